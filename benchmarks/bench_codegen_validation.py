@@ -0,0 +1,70 @@
+"""
+Validation throughput of a large response payload using validators composed
+by `construct_schema_validators` against validators compiled from generated
+source by `flex.validation.codegen`.
+
+    $ python benchmarks/bench_codegen_validation.py
+"""
+from __future__ import print_function
+
+import functools
+import timeit
+
+from flex.validation.common import validate_object
+from flex.validation.codegen import generate_compiled_schema_validator
+from flex.validation.schema import construct_schema_validators
+
+
+NUMBER_OF_ITEMS = 10000
+REPEAT = 3
+
+SCHEMA = {
+    'type': 'array',
+    'items': {
+        'type': 'object',
+        'required': ['id', 'name'],
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1},
+            'name': {'type': 'string', 'minLength': 1, 'maxLength': 64},
+            'price': {'type': 'number', 'minimum': 0},
+            'tags': {
+                'type': 'array',
+                'maxItems': 10,
+                'items': {'type': 'string', 'pattern': '^[a-z]+$'},
+            },
+        },
+    },
+}
+
+
+def report(label, seconds, number=NUMBER_OF_ITEMS):
+    print("{0:<30} {1:>10.2f} us/item".format(label, seconds / number * 1e6))
+
+
+def main():
+    payload = [
+        {
+            'id': i + 1,
+            'name': 'item-{0}'.format(i),
+            'price': i * 1.5,
+            'tags': ['red', 'green', 'blue'],
+        } for i in range(NUMBER_OF_ITEMS)
+    ]
+
+    validator = functools.partial(
+        validate_object,
+        field_validators=construct_schema_validators(SCHEMA, {}),
+        context={},
+    )
+    compiled_validator = generate_compiled_schema_validator(SCHEMA, {})
+
+    report('construct_schema_validators', min(timeit.repeat(
+        lambda: validator(payload), number=1, repeat=REPEAT,
+    )))
+    report('codegen', min(timeit.repeat(
+        lambda: compiled_validator(payload), number=1, repeat=REPEAT,
+    )))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Per-request latency of `flex.core.validate_api_*` against a compiled
+`SchemaValidator` using the expanded petstore example schema.
+
+    $ python benchmarks/bench_compiled_validation.py
+"""
+from __future__ import print_function
+
+import json
+import os
+import timeit
+
+import flex
+from flex.core import (
+    validate_api_request,
+    validate_api_response,
+)
+from flex.http import (
+    Request,
+    Response,
+)
+
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PATH = os.path.join(
+    DIR, '..', 'tests', 'core', 'example_schemas', 'petstore-expanded.yaml',
+)
+
+NUMBER = 2000
+
+
+def report(label, seconds, number=NUMBER):
+    print("{0:<44} {1:>10.1f} us/call".format(label, seconds / number * 1e6))
+
+
+def main():
+    schema = flex.load(SCHEMA_PATH)
+    compiled = flex.compile(schema)
+    codegen = flex.compile(schema, codegen=True)
+
+    request = Request(
+        url='http://petstore.swagger.wordnik.com/api/pets?tags=dog,cat&limit=10',
+        method='get',
+        content_type='application/json',
+    )
+    response = Response(
+        request=request,
+        content=json.dumps([
+            {'id': i, 'name': 'pet-{0}'.format(i), 'tag': 'dog'} for i in range(10)
+        ]),
+        url=request.url,
+        status_code=200,
+        content_type='application/json',
+    )
+
+    report('validate_api_request', timeit.timeit(
+        lambda: validate_api_request(schema, request), number=NUMBER,
+    ))
+    report('SchemaValidator.validate_request', timeit.timeit(
+        lambda: compiled.validate_request(request), number=NUMBER,
+    ))
+    report('validate_api_response', timeit.timeit(
+        lambda: validate_api_response(schema, response, 'get'), number=NUMBER,
+    ))
+    report('SchemaValidator.validate_response', timeit.timeit(
+        lambda: compiled.validate_response(response, 'get'), number=NUMBER,
+    ))
+    report('SchemaValidator(codegen).validate_response', timeit.timeit(
+        lambda: codegen.validate_response(response, 'get'), number=NUMBER,
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Time to parse a large json response body with each installed json decoder.
+
+    $ python benchmarks/bench_json_decoders.py
+"""
+from __future__ import print_function
+
+import json
+import timeit
+
+from flex.decoders import (
+    JSON_DECODERS,
+    json_decoder,
+)
+from flex.http import (
+    Request,
+    Response,
+)
+
+
+NUMBER = 20
+
+
+def report(label, seconds, number=NUMBER):
+    print("{0:<44} {1:>10.2f} ms/call".format(label, seconds / number * 1e3))
+
+
+def main():
+    content = json.dumps([
+        {
+            'id': i,
+            'name': 'pet-{0}'.format(i),
+            'tag': 'dog',
+            'weight': i / 3.0,
+            'owners': [{'id': j, 'email': 'owner-{0}@example.com'.format(j)} for j in range(3)],
+        } for i in range(20000)
+    ]).encode('utf-8')
+    request = Request(url='http://www.example.com/api/pets', method='get')
+
+    print("{0} byte response body".format(len(content)))
+
+    for name in JSON_DECODERS:
+        with json_decoder(name):
+            report('Response.data ({0})'.format(name), timeit.timeit(
+                lambda: Response(
+                    request=request,
+                    content=content,
+                    url=request.url,
+                    status_code=200,
+                    content_type='application/json',
+                ).data,
+                number=NUMBER,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Peak memory and time to validate a large json array response body, read in
+full versus streamed in chunks.
+
+    $ python benchmarks/bench_streamed_response.py
+"""
+from __future__ import print_function
+
+import json
+import time
+import tracemalloc
+
+import flex
+from flex.http import (
+    Request,
+    Response,
+)
+
+
+SCHEMA = {
+    'swagger': '2.0',
+    'info': {'title': 'bench', 'version': '1'},
+    'paths': {
+        '/pets': {
+            'get': {
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'required': ['id', 'name'],
+                                'properties': {
+                                    'id': {'type': 'integer', 'minimum': 0},
+                                    'name': {'type': 'string'},
+                                    'tags': {'type': 'array', 'items': {'type': 'string'}},
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+NUM_ITEMS = 10000
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_body():
+    yield b'['
+    for index in range(NUM_ITEMS):
+        if index:
+            yield b','
+        yield json.dumps({
+            'id': index, 'name': 'pet-{0}'.format(index), 'tags': ['dog', 'cat'],
+        }).encode('utf-8')
+    yield b']'
+
+
+def iter_chunks():
+    buffer = []
+    size = 0
+    for chunk in iter_body():
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= CHUNK_SIZE:
+            yield b''.join(buffer)
+            buffer, size = [], 0
+    yield b''.join(buffer)
+
+
+def measure(label, validator, build_response):
+    response = build_response()
+    start = time.time()
+    validator.validate_response(response, request_method='get')
+    elapsed = time.time() - start
+
+    response = build_response()
+    tracemalloc.start()
+    validator.validate_response(response, request_method='get')
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("{0:<24} {1:>8.2f} s {2:>10.1f} MB peak".format(label, elapsed, peak / 1e6))
+
+
+def main():
+    validator = flex.compile(flex.load(SCHEMA))
+    request = Request(url='http://www.example.com/pets', method='get')
+
+    def build_response(**kwargs):
+        return Response(
+            request=request,
+            url=request.url,
+            status_code=200,
+            content_type='application/json',
+            **kwargs
+        )
+
+    measure('content', validator, lambda: build_response(
+        content=b''.join(iter_body()),
+    ))
+    measure('stream', validator, lambda: build_response(
+        content=None, stream=iter_chunks(),
+    ))
+
+
+if __name__ == '__main__':
+    main()
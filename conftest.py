@@ -1,6 +1,12 @@
+import sys
+
 import pytest
 
 
+if sys.version_info < (3, 6):
+    collect_ignore = ['tests/core/test_aio.py']
+
+
 @pytest.fixture()
 def msg_assertions():
     from tests.utils import (
@@ -8,4 +8,4 @@ import pkg_resources
 __version__ = pkg_resources.get_distribution("flex").version
 VERSION = __version__
 
-from flex.core import load  # NOQA
+from flex.core import load, compile  # NOQA
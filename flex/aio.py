@@ -0,0 +1,237 @@
+"""
+Asyncio counterparts of the `flex.core` api, for use from ASGI and other
+asyncio based applications without blocking the event loop.
+
+Schemas are loaded in an executor since loading may read files or fetch urls.
+Requests and responses with bodies larger than `EXECUTOR_THRESHOLD` bytes
+are validated in an executor, while smaller ones are validated directly on
+the event loop where the cost of handing them to an executor would outweigh
+the cost of validating them.
+
+Requires python 3.5+.
+"""
+import asyncio
+import functools
+
+from requests.structures import CaseInsensitiveDict
+from six.moves import urllib_parse as urlparse
+
+from flex import core
+from flex.compiled import SchemaValidator
+from flex.constants import EMPTY
+from flex.http import (
+    Request,
+    Response,
+    normalize_request,
+    normalize_response,
+)
+
+
+# The size in bytes of the request and response bodies above which they are
+# validated in an executor.
+EXECUTOR_THRESHOLD = 64 * 1024
+
+
+async def _run_in_executor(func, *args, executor=None, **kwargs):
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def read_stream(stream):
+    """
+    Read an async iterable of text or bytes chunks, such as
+    `aiohttp.StreamReader.iter_chunked` or starlette's `Request.stream`, into
+    a single body.
+    """
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+    if chunks and isinstance(chunks[0], str):
+        return ''.join(chunks)
+    return b''.join(chunks)
+
+
+async def load_source(source, executor=None):
+    return await _run_in_executor(core.load_source, source, executor=executor)
+
+
+async def load(target, executor=None):
+    """
+    Given one of the supported target formats, load a swagger schema into it's
+    python representation in an executor.
+    """
+    return await _run_in_executor(core.load, target, executor=executor)
+
+
+def _get_body_size(body):
+    if body is None or body is EMPTY:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+async def _read_response_stream(response):
+    """
+    Read the body of a normalized response whose `stream` is an async
+    iterable of chunks into its `content`.
+    """
+    if response.content is None and hasattr(response.stream, '__aiter__'):
+        response.content = await read_stream(response.stream)
+        response.stream = None
+    return response
+
+
+async def _validate(func, size, *args, executor=None, threshold=EXECUTOR_THRESHOLD,
+                    **kwargs):
+    if size > threshold:
+        return await _run_in_executor(func, *args, executor=executor, **kwargs)
+    return func(*args, **kwargs)
+
+
+async def validate_api_request(schema, raw_request, fail_fast=False, executor=None,
+                               threshold=EXECUTOR_THRESHOLD):
+    """
+    Validate a request against a swagger schema, or a compiled
+    `SchemaValidator`.
+    """
+    request = normalize_request(raw_request)
+
+    if isinstance(schema, SchemaValidator):
+        func = schema.validate_request
+    else:
+        func = functools.partial(core.validate_api_request, schema)
+
+    await _validate(
+        func, _get_body_size(request.body), request, fail_fast=fail_fast,
+        executor=executor, threshold=threshold,
+    )
+
+
+async def validate_api_response(schema, raw_response, request_method='get', raw_request=None,
+                                fail_fast=False, executor=None, threshold=EXECUTOR_THRESHOLD):
+    """
+    Validate the response of an api call against a swagger schema, or a
+    compiled `SchemaValidator`.  A response `stream` which is an async
+    iterable is read before the response is validated.
+    """
+    request = None
+    if raw_request is not None:
+        request = normalize_request(raw_request)
+
+    if raw_response is None:
+        return
+    response = await _read_response_stream(normalize_response(raw_response, request=request))
+
+    if isinstance(schema, SchemaValidator):
+        func = schema.validate_response
+    else:
+        func = functools.partial(core.validate_api_response, schema)
+
+    await _validate(
+        func, _get_body_size(response.content), response, request_method,
+        fail_fast=fail_fast, executor=executor, threshold=threshold,
+    )
+
+
+async def validate_api_call(schema, raw_request, raw_response, fail_fast=False,
+                            executor=None, threshold=EXECUTOR_THRESHOLD):
+    """
+    Validate the request/response cycle of an api call against a swagger
+    schema, or a compiled `SchemaValidator`.
+    """
+    request = normalize_request(raw_request)
+    response = await _read_response_stream(normalize_response(raw_response, request=request))
+
+    if isinstance(schema, SchemaValidator):
+        func = schema.validate_api_call
+    else:
+        func = functools.partial(core.validate_api_call, schema)
+
+    await _validate(
+        func, _get_body_size(request.body) + _get_body_size(response.content),
+        request, response, fail_fast=fail_fast, executor=executor, threshold=threshold,
+    )
+
+
+def _decode_asgi_headers(raw_headers):
+    headers = CaseInsensitiveDict()
+    for key, value in raw_headers:
+        key = key.decode('latin-1')
+        value = value.decode('latin-1')
+        if key in headers:
+            headers[key] = '{0},{1}'.format(headers[key], value)
+        else:
+            headers[key] = value
+    return headers
+
+
+async def normalize_asgi_request(scope, receive):
+    """
+    Given the `scope` and `receive` callable of an ASGI http connection,
+    read the request body and normalize the request to the internal Request
+    class.  The body is available as `request.body` to be handed on to the
+    application.
+    """
+    if scope.get('type') != 'http':
+        raise TypeError("Cannot normalize this request object")
+
+    headers = _decode_asgi_headers(scope.get('headers', []))
+
+    host = headers.get('host')
+    if host is None and scope.get('server'):
+        host = '{0}:{1}'.format(*scope['server'])
+    url = urlparse.urlunsplit((
+        scope.get('scheme', 'http'),
+        host or '',
+        scope.get('root_path', '') + scope['path'],
+        scope.get('query_string', b'').decode('latin-1'),
+        '',
+    ))
+
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message['type'] != 'http.request':
+            break
+        chunks.append(message.get('body', b''))
+        more_body = message.get('more_body', False)
+
+    return Request(
+        url=url,
+        method=scope['method'].lower(),
+        content_type=headers.get('content-type'),
+        body=b''.join(chunks),
+        request=scope,
+        headers=headers,
+    )
+
+
+def normalize_asgi_response(messages, request):
+    """
+    Given the messages an ASGI application sent for an http response, and the
+    normalized request, normalize the response to the internal Response class.
+    """
+    start = None
+    chunks = []
+    for message in messages:
+        if message['type'] == 'http.response.start':
+            start = message
+        elif message['type'] == 'http.response.body':
+            chunks.append(message.get('body', b''))
+    if start is None:
+        raise TypeError("Cannot normalize this response object")
+
+    headers = _decode_asgi_headers(start.get('headers', []))
+
+    return Response(
+        request=request,
+        content=b''.join(chunks),
+        url=request.url,
+        status_code=start['status'],
+        content_type=headers.get('content-type'),
+        headers=headers,
+        response=messages,
+    )
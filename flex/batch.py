@@ -0,0 +1,202 @@
+"""
+Validation of large numbers of recorded api calls, such as captures of
+production traffic, across a pool of worker processes.
+"""
+import base64
+import collections
+import itertools
+import json
+import multiprocessing
+
+import six
+from requests.structures import CaseInsensitiveDict
+
+from flex.compiled import SchemaValidator
+from flex.constants import EMPTY
+from flex.decoders import decode_json
+from flex.exceptions import ValidationError
+from flex.http import (
+    Request,
+    Response,
+)
+
+
+class BatchResult(collections.namedtuple('BatchResult', ['index', 'error'])):
+    """
+    The result of validating the api call at position `index` of a batch.
+    `error` is the `ValidationError` raised for the call, or `None` if the
+    call is valid.
+    """
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        return self.error is None
+
+
+# The `SchemaValidator` used by each worker process, constructed once when the
+# worker starts.
+_worker_validator = None
+
+
+def _initialize_worker(schema, codegen):
+    global _worker_validator
+    _worker_validator = SchemaValidator(schema, codegen=codegen)
+
+
+def _validate_record(validator, index, record):
+    raw_request, raw_response = record
+    try:
+        validator.validate_api_call(raw_request, raw_response)
+    except ValidationError as err:
+        return BatchResult(index, err)
+    return BatchResult(index, None)
+
+
+def _validate_chunk(chunk):
+    return [
+        _validate_record(_worker_validator, index, record)
+        for index, record in chunk
+    ]
+
+
+def _iter_chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_api_calls(schema, records, processes=None, chunk_size=100, codegen=False):
+    """
+    Validate an iterable of `(raw_request, raw_response)` records against a
+    loaded swagger schema, yielding a `BatchResult` for each record in the
+    order of the records.
+
+    The records are validated in chunks of `chunk_size` across a pool of
+    `processes` worker processes, each of which compiles the schema once when
+    it starts, so the records must be picklable.  Records are read from
+    `records` only as fast as they are validated.  With `processes=1` the
+    records are validated in this process.
+    """
+    if processes == 1:
+        validator = SchemaValidator(schema, codegen=codegen)
+        for index, record in enumerate(records):
+            yield _validate_record(validator, index, record)
+        return
+
+    pool = multiprocessing.Pool(
+        processes,
+        initializer=_initialize_worker,
+        initargs=(schema, codegen),
+    )
+    # Keep a couple of chunks queued for every worker without reading all of
+    # the records up front.
+    max_pending = 2 * (processes or multiprocessing.cpu_count())
+    pending = collections.deque()
+    try:
+        for chunk in _iter_chunks(enumerate(records), chunk_size):
+            pending.append(pool.apply_async(_validate_chunk, (chunk,)))
+            if len(pending) >= max_pending:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
+def _decode_har_body(body):
+    if not body or 'text' not in body:
+        return EMPTY
+    if body.get('encoding') == 'base64':
+        return base64.b64decode(body['text'])
+    return body['text']
+
+
+def _har_headers(headers):
+    return CaseInsensitiveDict(
+        (header['name'], header['value']) for header in headers
+    )
+
+
+def iter_har_records(har):
+    """
+    Given a parsed HAR capture, yield a `(Request, Response)` record for each
+    of its entries.
+    """
+    for entry in har['log']['entries']:
+        raw_request = entry['request']
+        raw_response = entry['response']
+        request_headers = _har_headers(raw_request.get('headers', []))
+        response_headers = _har_headers(raw_response.get('headers', []))
+        request = Request(
+            url=raw_request['url'],
+            method=raw_request['method'].lower(),
+            content_type=request_headers.get('Content-Type'),
+            body=_decode_har_body(raw_request.get('postData')),
+            headers=request_headers,
+        )
+        response = Response(
+            request=request,
+            content=_decode_har_body(raw_response.get('content')),
+            url=request.url,
+            status_code=raw_response['status'],
+            content_type=response_headers.get('Content-Type'),
+            headers=response_headers,
+        )
+        yield request, response
+
+
+def iter_jsonl_records(lines):
+    """
+    Given an iterable of json lines, each an object of the form::
+
+        {
+            "request": {"method": ..., "url": ..., "headers": {...}, "body": ...},
+            "response": {"status_code": ..., "headers": {...}, "body": ...}
+        }
+
+    yield a `(Request, Response)` record for each line.  Bodies which are not
+    strings are serialized to json, and missing bodies are `EMPTY`.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        record = decode_json(line)
+        raw_request = record['request']
+        raw_response = record['response']
+        request_headers = CaseInsensitiveDict(raw_request.get('headers') or {})
+        response_headers = CaseInsensitiveDict(raw_response.get('headers') or {})
+        request = Request(
+            url=raw_request['url'],
+            method=raw_request['method'].lower(),
+            content_type=request_headers.get('Content-Type'),
+            body=_jsonl_body(raw_request.get('body')),
+            headers=request_headers,
+        )
+        response = Response(
+            request=request,
+            content=_jsonl_body(raw_response.get('body')),
+            url=request.url,
+            status_code=raw_response['status_code'],
+            content_type=response_headers.get('Content-Type'),
+            headers=response_headers,
+        )
+        yield request, response
+
+
+def _jsonl_body(body):
+    if body is None:
+        return EMPTY
+    elif isinstance(body, six.string_types):
+        return body
+    return json.dumps(body)
@@ -1,20 +1,31 @@
+import json
+import time
+
 import click
 
+from flex.batch import (
+    iter_har_records,
+    iter_jsonl_records,
+    validate_api_calls,
+)
 from flex.exceptions import ValidationError
 from flex.core import load
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     '-s', '--source',
     help='Source; a url to a schema or a file path to a schema',
 )
-def main(source):
+@click.pass_context
+def main(ctx, source):
     """
     For a given command line supplied argument, negotiate the content, parse
     the schema and then return any issues to stdout or if no schema issues,
     return success exit code.
     """
+    if ctx.invoked_subcommand is not None:
+        return
     if source is None:
         click.echo(
             "You need to supply a file or url to a schema to a swagger schema, for"
@@ -27,3 +38,54 @@ def main(source):
         return 0
     except ValidationError as e:
         raise click.ClickException(str(e))
+
+
+@main.command()
+@click.option(
+    '-s', '--source', required=True,
+    help='Source; a url to a schema or a file path to a schema',
+)
+@click.option(
+    '-p', '--processes', type=int, default=None,
+    help='Number of worker processes.  Defaults to the number of cpus.',
+)
+@click.option(
+    '--chunk-size', type=int, default=100,
+    help='Number of api calls sent to a worker at a time.',
+)
+@click.option(
+    '--codegen', is_flag=True,
+    help='Validate response bodies with generated validators.',
+)
+@click.argument('traffic', type=click.File('r'))
+def batch(source, processes, chunk_size, codegen, traffic):
+    """
+    Validate the recorded api calls in TRAFFIC, a HAR capture (.har) or a
+    file of json lines, against the schema, printing every invalid call.
+    """
+    schema = load(source)
+    if traffic.name.endswith('.har'):
+        records = iter_har_records(json.load(traffic))
+    else:
+        records = iter_jsonl_records(traffic)
+
+    total = 0
+    invalid = 0
+    start = time.time()
+    for result in validate_api_calls(
+        schema, records, processes=processes, chunk_size=chunk_size, codegen=codegen,
+    ):
+        total += 1
+        if not result.is_valid:
+            invalid += 1
+            click.echo("Call {0} is invalid:\n{1}".format(result.index, result.error))
+    elapsed = time.time() - start
+
+    click.echo(
+        "Validated {0} api calls in {1:.2f}s ({2:.1f} calls/s), {3} invalid".format(
+            total, elapsed, total / elapsed if elapsed else 0.0, invalid,
+        )
+    )
+    if invalid:
+        ctx = click.get_current_context()
+        ctx.exit(1)
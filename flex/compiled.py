@@ -0,0 +1,209 @@
+from flex.constants import REQUEST_METHODS
+from flex.exceptions import (
+    ValidationError,
+    ErrorDict,
+    fail_fast_mode,
+)
+from flex.paths import PathRouter
+from flex.http import (
+    normalize_request,
+    normalize_response,
+)
+from flex.validation.codegen import generate_compiled_schema_validator
+from flex.validation.operation import construct_operation_validators
+from flex.validation.reference import SchemaContext
+from flex.validation.request import validate_request
+from flex.validation.response import (
+    generate_response_validator,
+    validate_response,
+)
+from flex.validation.schema import generate_schema_validator
+
+
+class SchemaValidator(object):
+    """
+    Request and response validation against a loaded swagger schema with all
+    of the per-operation validators constructed up front.
+
+    The module level `flex.core.validate_api_*` functions construct the
+    validators for the matched operation on every call.  A `SchemaValidator`
+    constructs them once, keyed by `(api_path, method)` for requests and
+    `(api_path, method, status_code)` for responses, and reuses them for every
+    subsequent call.  Request paths are matched using a `PathRouter` built
+    from the schema paths.
+
+    Validation runs against a `SchemaContext` for the schema so that every
+    `$ref` is resolved, and its validators constructed, only once.
+
+    With `codegen=True` response bodies are validated by validators compiled
+    from generated python source (see `flex.validation.codegen`).
+    """
+    def __init__(self, schema, codegen=False):
+        self.schema = schema
+        if codegen:
+            self.schema_validator_generator = generate_compiled_schema_validator
+        else:
+            self.schema_validator_generator = generate_schema_validator
+        self.context = SchemaContext(schema)
+        self.router = PathRouter(
+            schema['paths'],
+            base_path=schema.get('basePath', ''),
+            context=self.context,
+        )
+        self._operation_validators = {}
+        self._response_validators = {}
+        self.build()
+
+    def iter_operations(self):
+        for api_path, path_definition in self.schema['paths'].items():
+            path_definition = path_definition or {}
+            for method in REQUEST_METHODS:
+                operation_definition = path_definition.get(method)
+                if operation_definition is None:
+                    continue
+                yield api_path, method, path_definition, operation_definition
+
+    def build(self):
+        """
+        Construct the validators for every operation and every declared
+        response in the schema.
+        """
+        for api_path, method, path_definition, operation_definition in self.iter_operations():
+            self.get_operation_validators(
+                api_path=api_path,
+                method=method,
+                path_definition=path_definition,
+                operation_definition=operation_definition,
+            )
+            for status_code, response_definition in operation_definition['responses'].items():
+                self.get_response_validator(
+                    api_path=api_path,
+                    request_method=method,
+                    status_code=str(status_code),
+                    operation_definition=operation_definition,
+                    response_definition=response_definition,
+                    path_definition=path_definition,
+                )
+
+    def get_operation_validators(self, api_path, method, path_definition,
+                                 operation_definition, **kwargs):
+        key = (api_path, method)
+        try:
+            return self._operation_validators[key]
+        except KeyError:
+            validators = construct_operation_validators(
+                api_path=api_path,
+                path_definition=path_definition,
+                operation_definition=operation_definition,
+                context=self.context,
+            )
+            return self._operation_validators.setdefault(key, validators)
+
+    def get_response_validator(self, api_path, request_method, status_code,
+                               operation_definition, response_definition,
+                               path_definition, **kwargs):
+        key = (api_path, request_method, status_code)
+        try:
+            return self._response_validators[key]
+        except KeyError:
+            validator = generate_response_validator(
+                api_path=api_path,
+                operation_definition=operation_definition,
+                response_definition=response_definition,
+                path_definition=path_definition,
+                context=self.context,
+                schema_validator_generator=self.schema_validator_generator,
+            )
+            return self._response_validators.setdefault(key, validator)
+
+    def reference_cache_info(self):
+        """
+        Returns the hits, misses and size of the cache of resolved references
+        and their validators.
+        """
+        return self.context.reference_cache.cache_info()
+
+    def validate_request(self, raw_request, fail_fast=False):
+        request = normalize_request(raw_request)
+
+        with fail_fast_mode(fail_fast):
+            with ErrorDict():
+                validate_request(
+                    request=request,
+                    schema=self.context,
+                    router=self.router,
+                    operation_validators_factory=self.get_operation_validators,
+                )
+
+    def validate_response(self, raw_response, request_method='get', raw_request=None,
+                          fail_fast=False):
+        request = None
+        if raw_request is not None:
+            request = normalize_request(raw_request)
+
+        response = None
+        if raw_response is not None:
+            response = normalize_response(raw_response, request=request)
+
+        if response is not None:
+            with fail_fast_mode(fail_fast):
+                validate_response(
+                    response=response,
+                    request_method=request_method,
+                    schema=self.context,
+                    router=self.router,
+                    response_validator_factory=self.get_response_validator,
+                )
+
+    def is_valid_request(self, raw_request):
+        """
+        Returns whether the request is valid, stopping at the first error
+        found.
+        """
+        try:
+            self.validate_request(raw_request, fail_fast=True)
+        except ValidationError:
+            return False
+        return True
+
+    def is_valid_response(self, raw_response, request_method='get', raw_request=None):
+        """
+        Returns whether the response is valid, stopping at the first error
+        found.
+        """
+        try:
+            self.validate_response(
+                raw_response, request_method, raw_request, fail_fast=True,
+            )
+        except ValidationError:
+            return False
+        return True
+
+    def validate_api_call(self, raw_request, raw_response, fail_fast=False):
+        with fail_fast_mode(fail_fast):
+            request = normalize_request(raw_request)
+
+            with ErrorDict() as errors:
+                try:
+                    validate_request(
+                        request=request,
+                        schema=self.context,
+                        router=self.router,
+                        operation_validators_factory=self.get_operation_validators,
+                    )
+                except ValidationError as err:
+                    errors['request'].add_error(err.messages or getattr(err, 'detail'))
+                    return
+
+                response = normalize_response(raw_response, raw_request)
+
+                try:
+                    validate_response(
+                        response=response,
+                        request_method=request.method,
+                        schema=self.context,
+                        router=self.router,
+                        response_validator_factory=self.get_response_validator,
+                    )
+                except ValidationError as err:
+                    errors['response'].add_error(err.messages or getattr(err, 'detail'))
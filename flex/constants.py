@@ -120,6 +120,10 @@ class Empty(object):
     def __cmp__(self, other):
         raise TypeError('Empty cannot be compared to other values')
 
+    def __reduce__(self):
+        # Unpickles to the `EMPTY` singleton so that identity checks still hold.
+        return 'EMPTY'
+
 
 """
 Sentinal empty value for use with distinguishing `None` from a key not
@@ -162,3 +166,4 @@ REQUEST_METHODS = (GET, PUT, POST, DELETE, OPTIONS, HEAD, PATCH)
 
 # Environment variables
 FLEX_DISABLE_X_NULLABLE = 'FLEX_DISABLE_X_NULLABLE'
+FLEX_JSON_DECODER = 'FLEX_JSON_DECODER'
@@ -6,12 +6,16 @@ import requests
 from copy import deepcopy
 
 import six
-import json
 import yaml
 
 from flex._compat import Mapping
+from flex.compiled import SchemaValidator
 from flex.context_managers import ErrorDict
-from flex.exceptions import ValidationError
+from flex.decoders import decode_json
+from flex.exceptions import (
+    ValidationError,
+    fail_fast_mode,
+)
 from flex.loading.definitions import (
     definitions_validator,
 )
@@ -62,7 +66,7 @@ def load_source(source):
 
     try:
         try:
-            return json.loads(raw_source)
+            return decode_json(raw_source)
         except ValueError:
             pass
 
@@ -100,27 +104,61 @@ def load(target):
     return parse(raw_schema)
 
 
-def validate(raw_schema, target=None, **kwargs):
+def compile(schema, codegen=False):
+    """
+    Given a loaded swagger schema, construct a `SchemaValidator` which builds
+    the request and response validators for every operation once so that they
+    can be reused across api calls.
+
+    If `codegen` is set, response bodies are validated using validators
+    compiled from generated python source.
+    """
+    return SchemaValidator(schema, codegen=codegen)
+
+
+def validate(raw_schema, target=None, fail_fast=False, **kwargs):
     """
     Given the python representation of a JSONschema as defined in the swagger
     spec, validate that the schema complies to spec.  If `target` is provided,
     that target will be validated against the provided schema.
+
+    With `fail_fast`, validation of `target` stops at the first error found.
     """
     schema = schema_validator(raw_schema, **kwargs)
     if target is not None:
-        validate_object(target, schema=schema, **kwargs)
+        with fail_fast_mode(fail_fast):
+            validate_object(target, schema=schema, **kwargs)
+
+
+def is_valid(raw_schema, target, **kwargs):
+    """
+    Returns whether `target` is valid against the swagger schema
+    `raw_schema`, stopping at the first error found.
+    """
+    try:
+        validate(raw_schema, target, fail_fast=True, **kwargs)
+    except ValidationError:
+        return False
+    return True
 
 
-def validate_api_request(schema, raw_request):
+def validate_api_request(schema, raw_request, fail_fast=False):
+    """
+    Validate a request against a swagger schema.  With `fail_fast`, validation
+    stops at the first error found.
+    """
     request = normalize_request(raw_request)
 
-    with ErrorDict():
-        validate_request(request=request, schema=schema)
+    with fail_fast_mode(fail_fast):
+        with ErrorDict():
+            validate_request(request=request, schema=schema)
 
 
-def validate_api_response(schema, raw_response, request_method='get', raw_request=None):
+def validate_api_response(schema, raw_response, request_method='get', raw_request=None,
+                          fail_fast=False):
     """
-    Validate the response of an api call against a swagger schema.
+    Validate the response of an api call against a swagger schema.  With
+    `fail_fast`, validation stops at the first error found.
     """
     request = None
     if raw_request is not None:
@@ -131,38 +169,67 @@ def validate_api_response(schema, raw_response, request_method='get', raw_reques
         response = normalize_response(raw_response, request=request)
 
     if response is not None:
-        validate_response(
-            response=response,
-            request_method=request_method,
-            schema=schema
+        with fail_fast_mode(fail_fast):
+            validate_response(
+                response=response,
+                request_method=request_method,
+                schema=schema
+            )
+
+
+def is_valid_api_request(schema, raw_request):
+    """
+    Returns whether a request is valid against a swagger schema, stopping at
+    the first error found.
+    """
+    try:
+        validate_api_request(schema, raw_request, fail_fast=True)
+    except ValidationError:
+        return False
+    return True
+
+
+def is_valid_api_response(schema, raw_response, request_method='get', raw_request=None):
+    """
+    Returns whether the response of an api call is valid against a swagger
+    schema, stopping at the first error found.
+    """
+    try:
+        validate_api_response(
+            schema, raw_response, request_method, raw_request, fail_fast=True,
         )
+    except ValidationError:
+        return False
+    return True
 
 
-def validate_api_call(schema, raw_request, raw_response):
+def validate_api_call(schema, raw_request, raw_response, fail_fast=False):
     """
     Validate the request/response cycle of an api call against a swagger
     schema.  Request/Response objects from the `requests` and `urllib` library
-    are supported.
+    are supported.  With `fail_fast`, validation stops at the first error
+    found.
     """
-    request = normalize_request(raw_request)
-
-    with ErrorDict() as errors:
-        try:
-            validate_request(
-                request=request,
-                schema=schema,
-            )
-        except ValidationError as err:
-            errors['request'].add_error(err.messages or getattr(err, 'detail'))
-            return
-
-        response = normalize_response(raw_response, raw_request)
+    with fail_fast_mode(fail_fast):
+        request = normalize_request(raw_request)
 
-        try:
-            validate_response(
-                response=response,
-                request_method=request.method,
-                schema=schema
-            )
-        except ValidationError as err:
-            errors['response'].add_error(err.messages or getattr(err, 'detail'))
+        with ErrorDict() as errors:
+            try:
+                validate_request(
+                    request=request,
+                    schema=schema,
+                )
+            except ValidationError as err:
+                errors['request'].add_error(err.messages or getattr(err, 'detail'))
+                return
+
+            response = normalize_response(raw_response, raw_request)
+
+            try:
+                validate_response(
+                    response=response,
+                    request_method=request.method,
+                    schema=schema
+                )
+            except ValidationError as err:
+                errors['response'].add_error(err.messages or getattr(err, 'detail'))
@@ -5,6 +5,7 @@ from flex.exceptions import (
     ValidationError,
     ErrorDict,
     ErrorList,
+    fail_fast_mode,
 )
 from flex.constants import (
     OBJECT,
@@ -21,6 +22,19 @@ from flex.functional import (
 )
 
 
+def is_valid(validator, obj, **kwargs):
+    """
+    Returns whether `obj` is valid for `validator`.  Validation stops at the
+    first error found, which is then discarded.
+    """
+    with fail_fast_mode():
+        try:
+            validator(obj, **kwargs)
+        except ValidationError:
+            return False
+    return True
+
+
 class ValidationList(list):
     def __init__(self, value=None):
         super(ValidationList, self).__init__()
@@ -46,6 +60,9 @@ class ValidationList(list):
     def __call__(self, *args, **kwargs):
         return self.validate_object(*args, **kwargs)
 
+    def is_valid(self, obj, **kwargs):
+        return is_valid(self, obj, **kwargs)
+
 
 class ValidationDict(collections.defaultdict):
     def __init__(self, validators=None):
@@ -79,3 +96,6 @@ class ValidationDict(collections.defaultdict):
 
     def __call__(self, *args, **kwargs):
         return self.validate_object(*args, **kwargs)
+
+    def is_valid(self, obj, **kwargs):
+        return is_valid(self, obj, **kwargs)
@@ -0,0 +1,255 @@
+"""
+JSON decoding for request bodies, response bodies and schema sources.
+
+Faster third party decoders are used when they are installed, in the order
+`orjson`, `simdjson`, `ujson`, falling back to the standard library `json`
+module.  The decoder may be chosen with `set_json_decoder`, the
+`json_decoder` context manager, or the `FLEX_JSON_DECODER` environment
+variable.
+"""
+import codecs
+import collections
+import contextlib
+import json
+import os
+import re
+
+import six
+
+try:
+    # python3
+    from json import JSONDecodeError
+except ImportError:
+    # backfill python2
+    class JSONDecodeError(ValueError):
+        pass
+
+from flex.constants import FLEX_JSON_DECODER
+
+
+AUTO = 'auto'
+STDLIB = 'json'
+
+
+def _stdlib_loads(raw):
+    if isinstance(raw, six.binary_type):
+        raw = raw.decode('utf-8')
+    return json.loads(raw)
+
+
+# Mapping of decoder name to a `loads` function which accepts text or utf-8
+# encoded bytes, in order of preference.
+JSON_DECODERS = collections.OrderedDict()
+
+
+def register_json_decoder(name, loads):
+    """
+    Register a `loads` function under `name` so that it can be selected with
+    `set_json_decoder`.
+    """
+    JSON_DECODERS[name] = loads
+
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    register_json_decoder('orjson', orjson.loads)
+
+try:
+    import simdjson
+except ImportError:
+    pass
+else:
+    register_json_decoder('simdjson', simdjson.loads)
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    register_json_decoder('ujson', ujson.loads)
+
+register_json_decoder(STDLIB, _stdlib_loads)
+
+
+_active_decoder = {}
+
+
+def set_json_decoder(name=AUTO):
+    """
+    Select the decoder used by `decode_json`.  `auto` selects the fastest
+    installed decoder.
+    """
+    if name == AUTO:
+        name = next(iter(JSON_DECODERS))
+    if name not in JSON_DECODERS:
+        raise ValueError(
+            "Unknown JSON decoder `{0}`.  Expected one of: `{1}`".format(
+                name, list(JSON_DECODERS.keys()),
+            )
+        )
+    _active_decoder['name'] = name
+    _active_decoder['loads'] = JSON_DECODERS[name]
+
+
+def get_json_decoder():
+    """
+    Returns the name of the decoder used by `decode_json`.
+    """
+    return _active_decoder['name']
+
+
+@contextlib.contextmanager
+def json_decoder(name):
+    previous = get_json_decoder()
+    set_json_decoder(name)
+    try:
+        yield
+    finally:
+        set_json_decoder(previous)
+
+
+def decode_json(raw):
+    """
+    Decode `raw`, which may be text or utf-8 encoded bytes.
+
+    Anything rejected by a third party decoder is decoded again with the
+    standard library, so that documents only it accepts (such as `NaN`) still
+    decode, and invalid documents raise the same `JSONDecodeError` regardless
+    of the decoder in use.  Note that some decoders return integers larger
+    than 64 bits as floats.
+    """
+    loads = _active_decoder['loads']
+    if loads is not _stdlib_loads:
+        try:
+            return loads(raw)
+        except (ValueError, TypeError, OverflowError):
+            pass
+    try:
+        return _stdlib_loads(raw)
+    except ValueError as e:
+        if isinstance(e, JSONDecodeError):
+            # this will only be True for Python3+
+            raise e
+        raise _decode_error(str(e), '', 0)
+
+
+def _decode_error(message, doc, position):
+    if six.PY2:
+        return JSONDecodeError(message)
+    return JSONDecodeError(message, doc, position)
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER_CONTINUATION = re.compile(r'[0-9.eE+\-]*\Z')
+
+
+def _iter_text_chunks(chunks):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, six.binary_type):
+                chunk = decoder.decode(chunk)
+            if chunk:
+                yield chunk
+        # raises for a body which ends part way through a character.
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError as e:
+        raise _decode_error(str(e), '', 0)
+
+
+class _ChunkReader(object):
+    """
+    A buffer over an iterator of text chunks holding only the text which has
+    not been decoded yet.
+    """
+    def __init__(self, chunks):
+        self.chunks = _iter_text_chunks(chunks)
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+    def read(self, size):
+        """
+        Read chunks until at least `size` more characters are buffered.
+        Returns whether any more text was read.
+        """
+        chunks = []
+        length = 0
+        while length < size and not self.exhausted:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                self.exhausted = True
+            else:
+                chunks.append(chunk)
+                length += len(chunk)
+        if not chunks:
+            return False
+        chunks.insert(0, self.buffer[self.position:])
+        self.buffer = ''.join(chunks)
+        self.position = 0
+        return True
+
+    def peek(self):
+        """
+        Skip any whitespace and return the next character, or an empty string
+        at the end of the body.
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read(1):
+                return ''
+
+    def expect(self, characters, message):
+        character = self.peek()
+        if not character or character not in characters:
+            raise _decode_error(message, self.buffer, self.position)
+        self.position += 1
+        return character
+
+    def decode(self):
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                # The value may continue in the next chunks.  Reading at
+                # least as much again as is buffered keeps the number of
+                # attempts to decode a large value logarithmic in its size.
+                if not self.read(len(self.buffer) - self.position + 1):
+                    raise
+                continue
+            if NUMBER_CONTINUATION.match(self.buffer, end) and self.read(1):
+                # A number may continue in the next chunk.
+                continue
+            self.position = end
+            return value
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally decode a json array from an iterable of text or utf-8
+    encoded bytes chunks, yielding each element as soon as it has been read
+    so that only one element of the array is held in memory at a time.
+    Raises `JSONDecodeError` if the body is not a valid json array.
+    """
+    reader = _ChunkReader(chunks)
+    reader.expect('[', "Expecting '['")
+    if reader.peek() == ']':
+        reader.position += 1
+    else:
+        while True:
+            reader.peek()
+            yield reader.decode()
+            if reader.expect(',]', "Expecting ',' delimiter") == ']':
+                break
+    if reader.peek():
+        raise _decode_error("Extra data", reader.buffer, reader.position)
+
+
+set_json_decoder(os.environ.get(FLEX_JSON_DECODER, AUTO))
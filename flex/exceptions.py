@@ -2,6 +2,8 @@ from __future__ import unicode_literals
 
 import six
 import collections
+import contextlib
+import threading
 
 from flex._compat import Mapping
 from flex.utils import (
@@ -10,6 +12,29 @@ from flex.utils import (
 )
 
 
+_validation_state = threading.local()
+
+
+def is_fail_fast_mode():
+    return getattr(_validation_state, 'fail_fast', False)
+
+
+@contextlib.contextmanager
+def fail_fast_mode(enabled=True):
+    """
+    While enabled, error collections raise as soon as an error is added to
+    them rather than collecting every error, so validation stops at the first
+    error found.  Every enclosing collection adds the error and re-raises, so
+    the error is still reported under its full path.
+    """
+    previous = is_fail_fast_mode()
+    _validation_state.fail_fast = enabled
+    try:
+        yield
+    finally:
+        _validation_state.fail_fast = previous
+
+
 class ErrorCollectionMixin(object):
     def __enter__(self):
         return self
@@ -29,7 +54,7 @@ class ErrorList(ErrorCollectionMixin, list):
     def __init__(self, value=None):
         super(ErrorList, self).__init__()
         if value:
-            self.add_error(value)
+            self.extend_error(value)
 
     def add_error(self, error):
         """
@@ -38,9 +63,14 @@ class ErrorList(ErrorCollectionMixin, list):
 
         Otherwise, the value is appended.
         """
+        self.extend_error(error)
+        if self and is_fail_fast_mode():
+            self.raise_()
+
+    def extend_error(self, error):
         if is_non_string_iterable(error) and not isinstance(error, Mapping):
             for value in error:
-                self.add_error(value)
+                self.extend_error(value)
         else:
             self.append(error)
 
@@ -49,10 +79,12 @@ class ErrorDict(ErrorCollectionMixin, collections.defaultdict):
     def __init__(self, value=None):
         super(ErrorDict, self).__init__(ErrorList)
         for k, v in (value or {}).items():
-            self.add_error(k, v)
+            self[k].extend_error(v)
 
     def add_error(self, key, error):
-        self[key].add_error(error)
+        self[key].extend_error(error)
+        if self[key] and is_fail_fast_mode():
+            self.raise_()
 
 
 class ValidationError(ValueError):
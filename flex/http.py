@@ -4,18 +4,13 @@ import io
 import http
 import urllib
 
-try:
-    # python3
-    from json import JSONDecodeError
-except ImportError:
-    # backfill python2
-    class JSONDecodeError(ValueError):
-        pass
-
 from six.moves import urllib_parse as urlparse
-import json
 
 from flex.constants import EMPTY
+from flex.decoders import (  # noqa: F401
+    JSONDecodeError,
+    decode_json,
+)
 
 try:
     import django.http.request
@@ -56,6 +51,17 @@ else:
     _werkzeug_available = True
 
 
+class NotParsed(object):
+    def __reduce__(self):
+        # Unpickles to the `NOT_PARSED` singleton so that identity checks
+        # still hold.
+        return 'NOT_PARSED'
+
+
+# Sentinal value for a body which has not been parsed yet.
+NOT_PARSED = NotParsed()
+
+
 class URLMixin(object):
     @property
     def url_components(self):
@@ -80,17 +86,45 @@ class Request(URLMixin):
     instance of Request.
     """
     method = None
+    # The `flex.paths.PathMatch` from the most recent validation of this
+    # request's path against an api path.
+    path_match = None
 
-    def __init__(self, url, method, content_type=None, body=None, request=None, headers=None):
+    def __init__(self, url, method, content_type=None, body=None, request=None, headers=None,
+                 data=NOT_PARSED):
         self._request = request
         self.body = body
         self.url = url
         self.method = method
         self.content_type = content_type
         self.headers = headers or {}
+        if data is not NOT_PARSED:
+            self.data = data
+
+    @property
+    def body(self):
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+        self._data = NOT_PARSED
 
     @property
     def data(self):
+        """
+        The parsed body, which is cached until `body` is reassigned.  An
+        already parsed body may be assigned to avoid parsing it again.
+        """
+        if self._data is NOT_PARSED:
+            self._data = self.parse_body()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    def parse_body(self):
         """
         TODO: What is the right way to do this?
         """
@@ -99,16 +133,7 @@ class Request(URLMixin):
         elif self.body is EMPTY:
             return EMPTY
         elif self.content_type and self.content_type.startswith('application/json'):
-            try:
-                if isinstance(self.body, six.binary_type):
-                    return json.loads(self.body.decode('utf-8'))
-                else:
-                    return json.loads(self.body)
-            except ValueError as e:
-                if isinstance(e, JSONDecodeError):
-                    # this will only be True for Python3+
-                    raise e
-                raise JSONDecodeError(str(e))
+            return decode_json(self.body)
         elif self.content_type == 'application/x-www-form-urlencoded':
             return dict(urlparse.parse_qsl(self.body))
         else:
@@ -299,39 +324,83 @@ class Response(URLMixin):
     """
     _response = None
     status_code = None
+    # The `flex.paths.PathMatch` from the most recent validation of this
+    # response's path against an api path.
+    path_match = None
 
     def __init__(self, request, content, url, status_code, content_type,
-                 headers=None, response=None):
+                 headers=None, response=None, data=NOT_PARSED, stream=None):
         self._response = response
         self.request = request
         self.content = content
+        # An iterable of text or bytes chunks of a body which has not been
+        # read yet, used when `content` is `None`.
+        self.stream = stream
         self.url = url
         self.status_code = str(status_code)
         self.content_type = content_type
         self.headers = headers or {}
+        if data is not NOT_PARSED:
+            self.data = data
 
     @property
     def path(self):
         return urlparse.urlparse(self.url).path
 
+    @property
+    def content(self):
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self._content = value
+        self._data = NOT_PARSED
+
     @property
     def data(self):
-        if self.content is EMPTY:
-            return self.content
-        elif self.content_type and self.content_type.startswith('application/json'):
-            try:
-                if isinstance(self.content, six.binary_type):
-                    return json.loads(six.text_type(self.content, encoding='utf-8'))
-                else:
-                    return json.loads(self.content)
-            except ValueError as e:
-                if isinstance(e, JSONDecodeError):
-                    # this will only be True for Python3+
-                    raise e
-                raise JSONDecodeError(str(e))
+        """
+        The parsed content, which is cached until `content` is reassigned.  An
+        already parsed body may be assigned to avoid parsing it again.
+        """
+        if self._data is NOT_PARSED:
+            self._data = self.parse_content()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def is_streamed(self):
+        """
+        Whether the body is yet to be read from `stream`.  A streamed json
+        array body is validated one element at a time as it is read, and
+        is not kept once it has been validated.
+        """
+        return self.stream is not None and self.content is None and self._data is NOT_PARSED
+
+    @property
+    def is_json(self):
+        return bool(self.content_type) and self.content_type.startswith('application/json')
+
+    def parse_content(self):
+        content = self.content
+        if content is None and self.stream is not None:
+            content = _join_chunks(self.stream)
+        if content is EMPTY:
+            return content
+        elif self.is_json:
+            return decode_json(content)
         raise NotImplementedError("No content negotiation for this content type")
 
 
+def _join_chunks(chunks):
+    chunks = list(chunks)
+    if chunks and isinstance(chunks[0], six.binary_type):
+        return b''.join(chunks)
+    return ''.join(chunks)
+
+
 def _normalize_django_response(response, request=None):
     if not _django_available:
         raise TypeError("django is not installed")
@@ -461,6 +530,33 @@ def _normalize_werkzeug_response(response, request=None):
     )
 
 
+# The size of the chunks a streamed response body is read in.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def normalize_streaming_response(response, request=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Given a `requests` response made with `stream=True`, normalize it to the
+    internal Response class without reading the body, so that a json array
+    body is validated one element at a time as it is downloaded.
+    """
+    import requests
+    if not isinstance(response, requests.Response):
+        raise TypeError("Cannot normalize this response object")
+    if request is not None and not isinstance(request, Request):
+        request = normalize_request(request)
+
+    return Response(
+        request=request,
+        content=None,
+        url=response.url,
+        status_code=response.status_code,
+        content_type=response.headers.get('Content-Type'),
+        response=response,
+        stream=response.iter_content(chunk_size),
+    )
+
+
 RESPONSE_NORMALIZERS = (
     _normalize_django_response,
     _normalize_urllib_response,
@@ -1,6 +1,7 @@
 import itertools
 import collections
 import functools
+import operator
 import re
 
 from flex._compat import Mapping
@@ -8,6 +9,7 @@ from flex.exceptions import MultiplePathsFound
 from flex.error_messages import MESSAGES
 from flex.constants import (
     PATH,
+    INTEGER,
     REQUEST_METHODS,
 )
 from flex.parameters import (
@@ -102,21 +104,46 @@ def path_to_pattern(api_path, parameters):
     return pattern
 
 
+# Compiled path regexes keyed by the api path and the signature of the path
+# parameters that contribute to the pattern.  Like the `re` module cache, it is
+# cleared once it reaches its maximum size.
+PATH_REGEX_CACHE_SIZE = 512
+_path_regex_cache = {}
+
+
+def get_path_parameter_signature(parameters):
+    """
+    Returns a hashable value which identifies the parts of the parameter
+    definitions that `path_to_pattern` depends on.
+    """
+    return tuple(sorted(
+        (parameter['name'], parameter.get('type') == INTEGER)
+        for parameter in parameters
+        if parameter.get('in') == PATH
+    ))
+
+
 def path_to_regex(api_path, path_parameters, operation_parameters=None,
                   context=None):
     if context is None:
         context = {}
     if operation_parameters is None:
         operation_parameters = []
-    pattern = path_to_pattern(
-        api_path=api_path,
-        parameters=merge_parameter_lists(
-            context.get('parameters', {}).values(),
-            dereference_parameter_list(path_parameters, context),
-            dereference_parameter_list(operation_parameters, context),
-        ),
+    parameters = merge_parameter_lists(
+        context.get('parameters', {}).values(),
+        dereference_parameter_list(path_parameters, context),
+        dereference_parameter_list(operation_parameters, context),
     )
-    return re.compile(pattern)
+    key = (api_path, get_path_parameter_signature(parameters))
+    try:
+        return _path_regex_cache[key]
+    except KeyError:
+        pass
+    regex = re.compile(path_to_pattern(api_path=api_path, parameters=parameters))
+    if len(_path_regex_cache) >= PATH_REGEX_CACHE_SIZE:
+        _path_regex_cache.clear()
+    _path_regex_cache[key] = regex
+    return regex
 
 
 def extract_path_parameters(path_definition):
@@ -138,73 +165,227 @@ def extract_operation_parameters(path_definition):
 NORMALIZE_SLASH_REGEX = re.compile(r"/+")
 
 
-def match_path_to_api_path(path_definitions, target_path, base_path='',
-                           context=None):
+# Characters that keep their regex meaning in the patterns produced by
+# `path_to_pattern`, since only `.`, `{` and `}` are escaped.
+REGEX_SPECIAL_CHARS = frozenset('\\^$*+?()[]|')
+
+
+def normalize_path(path):
+    return re.sub(NORMALIZE_SLASH_REGEX, '/', path)
+
+
+# The result of matching a request or response `path` to one of the api paths,
+# along with the raw string `values` of the path parameters captured while
+# matching.
+PathMatch = collections.namedtuple('PathMatch', ['api_path', 'path', 'values'])
+
+
+class PathRouterNode(object):
     """
-    Match a request or response path to one of the api paths.
+    A single segment position in a `PathRouter`.  Literal child segments are
+    looked up by exact value, parametrized child segments are tried in turn
+    against their compiled pattern.
+    """
+    __slots__ = ('literals', 'patterns', 'api_paths')
 
-    Anything other than exactly one match is an error condition.
+    def __init__(self):
+        self.literals = {}
+        self.patterns = collections.OrderedDict()
+        self.api_paths = []
+
+    def add_literal(self, segment):
+        return self.literals.setdefault(segment, PathRouterNode())
+
+    def add_pattern(self, pattern):
+        if pattern not in self.patterns:
+            self.patterns[pattern] = (
+                re.compile("^{0}$".format(pattern)),
+                PathRouterNode(),
+            )
+        return self.patterns[pattern][1]
+
+
+class PathRouter(object):
     """
-    if context is None:
-        context = {}
-    assert isinstance(context, Mapping)
-    if target_path.startswith(base_path):
-        # Convert all of the api paths into Path instances for easier regex
-        # matching.
-        normalized_target_path = re.sub(NORMALIZE_SLASH_REGEX, '/',
-                                        target_path)
-        matching_api_paths = list()
-        matching_api_paths_regex = list()
-        for p, v in path_definitions.items():
-            # Doing this to help with case where we might have base_path
-            # being just /, and then the path starts with / as well.
-            full_path = re.sub(NORMALIZE_SLASH_REGEX, '/', base_path + p)
-            r = path_to_regex(
-                api_path=full_path,
-                path_parameters=extract_path_parameters(v),
-                operation_parameters=extract_operation_parameters(v),
-                context=context,
+    Routing structure for matching request paths to the api paths of a
+    schema.  It is built once from the path definitions and resolves a path by
+    walking its segments through a trie rather than matching the path against
+    a regex for every api path.
+
+    Api paths whose literal parts contain regex special characters cannot be
+    represented as segments and are matched with the full regex from
+    `path_to_regex`.
+    """
+    def __init__(self, path_definitions, base_path='', context=None):
+        if context is None:
+            context = {}
+        self.base_path = base_path
+        self.root = PathRouterNode()
+        self.exact_paths = collections.defaultdict(list)
+        self.regex_paths = []
+        for index, (api_path, path_definition) in enumerate(path_definitions.items()):
+            self.add_path(index, api_path, path_definition or {}, context)
+
+    def add_path(self, index, api_path, path_definition, context):
+        # Doing this to help with case where we might have base_path
+        # being just /, and then the path starts with / as well.
+        full_path = normalize_path(self.base_path + api_path)
+        self.exact_paths[full_path].append(api_path)
+
+        parameters = merge_parameter_lists(
+            context.get('parameters', {}).values(),
+            dereference_parameter_list(extract_path_parameters(path_definition), context),
+            dereference_parameter_list(extract_operation_parameters(path_definition), context),
+        )
+
+        node = self.root
+        nodes = []
+        for segment in full_path.split('/'):
+            pattern, is_literal = self.process_segment(segment, parameters)
+            if pattern is None:
+                self.regex_paths.append((
+                    index,
+                    api_path,
+                    re.compile(path_to_pattern(full_path, parameters)),
+                ))
+                return
+            nodes.append((pattern, is_literal))
+
+        for pattern, is_literal in nodes:
+            if is_literal:
+                node = node.add_literal(pattern)
+            else:
+                node = node.add_pattern(pattern)
+        node.api_paths.append((index, api_path))
+
+    def process_segment(self, segment, parameters):
+        """
+        Returns a tuple of the value to match the segment by and whether that
+        value is a literal string.  Returns `None` for the value if the segment
+        cannot be matched independently of the rest of the path.
+        """
+        pattern_parts = []
+        is_literal = True
+        for part in re.split(PARAMETER_REGEX, segment):
+            pattern_part = process_path_part(part, parameters)
+            if pattern_part != escape_regex_special_chars(part):
+                is_literal = False
+            elif REGEX_SPECIAL_CHARS.intersection(part):
+                return None, False
+            pattern_parts.append(pattern_part)
+        if is_literal:
+            return segment, True
+        return ''.join(pattern_parts), False
+
+    def iter_matches(self, path):
+        """
+        Yields `(index, api_path, values)` for every api path that matches
+        `path`, where `values` are the captured path parameter values.
+        """
+        segments = path.split('/')
+        depth_limit = len(segments)
+        stack = [(self.root, 0, {})]
+        while stack:
+            node, depth, values = stack.pop()
+            if depth == depth_limit:
+                for index, api_path in node.api_paths:
+                    yield index, api_path, values
+                continue
+            segment = segments[depth]
+            child = node.literals.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1, values))
+            for regex, child in node.patterns.values():
+                match = regex.match(segment)
+                if match:
+                    child_values = dict(values)
+                    child_values.update(match.groupdict())
+                    stack.append((child, depth + 1, child_values))
+        for index, api_path, regex in self.regex_paths:
+            match = regex.match(path)
+            if match:
+                yield index, api_path, match.groupdict()
+
+    def match(self, target_path):
+        """
+        Match a request or response path to one of the api paths.
+
+        Anything other than exactly one match is an error condition.
+        """
+        return self.resolve(target_path).api_path
+
+    def resolve(self, target_path):
+        """
+        Match a request or response path to one of the api paths, returning a
+        `PathMatch` which carries the path parameter values captured while
+        matching so that they do not need to be extracted again.
+        """
+        path = target_path
+        if not target_path.startswith(self.base_path):
+            raise LookupError(
+                MESSAGES['path']['no_matching_paths_found'].format(target_path),
             )
-            if full_path == normalized_target_path:
-                matching_api_paths.append(p)
-            elif r.match(normalized_target_path):
-                matching_api_paths_regex.\
-                    append((p, r.match(normalized_target_path)))
 
+        normalized_target_path = normalize_path(target_path)
         # Keep it consistent with the previous behavior
-        target_path = target_path[len(base_path):]
-    else:
-        matching_api_paths = []
-        matching_api_paths_regex = []
-
-    if not matching_api_paths and not matching_api_paths_regex:
-        fstr = MESSAGES['path']['no_matching_paths_found'].format(target_path)
-        raise LookupError(fstr)
-    elif len(matching_api_paths) == 1:
-        return matching_api_paths[0]
-    elif len(matching_api_paths) > 1:
-        raise MultiplePathsFound(
-            MESSAGES['path']['multiple_paths_found'].format(
-                target_path, [v[0] for v in matching_api_paths],
+        target_path = target_path[len(self.base_path):]
+
+        matching_api_paths = self.exact_paths.get(normalized_target_path, [])
+        if len(matching_api_paths) > 1:
+            raise MultiplePathsFound(
+                MESSAGES['path']['multiple_paths_found'].format(
+                    target_path, matching_api_paths,
+                )
             )
+
+        matches = sorted(
+            self.iter_matches(normalized_target_path),
+            key=operator.itemgetter(0),
         )
-    elif len(matching_api_paths_regex) == 1:
-        return matching_api_paths_regex[0][0]
-    elif len(matching_api_paths_regex) > 1:
+        values_by_api_path = dict((api_path, values) for _, api_path, values in matches)
+
+        if len(matching_api_paths) == 1:
+            api_path = matching_api_paths[0]
+            return PathMatch(api_path, path, values_by_api_path.get(api_path, {}))
+
+        matching_api_paths_regex = [api_path for _, api_path, _ in matches]
+        if not matching_api_paths_regex:
+            raise LookupError(
+                MESSAGES['path']['no_matching_paths_found'].format(target_path),
+            )
+        elif len(matching_api_paths_regex) == 1:
+            api_path = matching_api_paths_regex[0]
+            return PathMatch(api_path, path, values_by_api_path[api_path])
+
         # TODO: This area needs improved logic.
         # We check to see if any of the matched paths is longers than
         # the others.  If so, we *assume* it is the correct match.  This is
         # going to be prone to false positives. in certain cases.
         matches_by_path_size = collections.defaultdict(list)
-        for path, match in matching_api_paths_regex:
-            matches_by_path_size[len(path)].append(path)
+        for api_path in matching_api_paths_regex:
+            matches_by_path_size[len(api_path)].append(api_path)
         longest_match = max(matches_by_path_size.keys())
         if len(matches_by_path_size[longest_match]) == 1:
-            return matches_by_path_size[longest_match][0]
+            api_path = matches_by_path_size[longest_match][0]
+            return PathMatch(api_path, path, values_by_api_path[api_path])
         raise MultiplePathsFound(
             MESSAGES['path']['multiple_paths_found'].format(
-                target_path, [v[0] for v in matching_api_paths_regex],
+                target_path, matching_api_paths_regex,
             )
         )
-    else:
-        return matching_api_paths_regex[0][0]
+
+
+def match_path_to_api_path(path_definitions, target_path, base_path='',
+                           context=None):
+    """
+    Match a request or response path to one of the api paths.
+
+    Anything other than exactly one match is an error condition.  When
+    matching many paths against the same path definitions, construct a
+    `PathRouter` once and use `PathRouter.match` instead.
+    """
+    if context is None:
+        context = {}
+    assert isinstance(context, Mapping)
+    router = PathRouter(path_definitions, base_path=base_path, context=context)
+    return router.match(target_path)
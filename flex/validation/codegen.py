@@ -0,0 +1,552 @@
+"""
+Code generating backend for schema validation.
+
+`construct_schema_validators` composes a schema's validators out of partials
+and decorators, so every constraint costs several python call frames.  The
+generator in this module walks the same schema and emits straight line python
+source with one function per schema, which is compiled once and raises the
+same `ValidationError` structures as `validate_object` does for the
+validators constructed by `construct_schema_validators`.
+
+Constraints without an inline implementation are validated by calling the
+validator `construct_schema_validators` would have used for them.
+"""
+import collections
+import functools
+import itertools
+
+from six.moves import urllib_parse as urlparse
+
+import jsonpointer
+
+from flex._compat import Mapping
+from flex.constants import (
+    EMPTY,
+    NULL,
+    BOOLEAN,
+    INTEGER,
+    NUMBER,
+    STRING,
+    ARRAY,
+    OBJECT,
+    PRIMITIVE_TYPES,
+)
+from flex.datastructures import ValidationDict
+from flex.exceptions import (
+    ValidationError,
+    ErrorDict,
+)
+from flex.error_messages import MESSAGES
+from flex.utils import get_type_for_value
+from flex.validation.common import (
+    noop,
+    validate_type,
+    validate_minimum,
+    validate_maximum,
+    validate_min_length,
+    validate_max_length,
+    validate_min_items,
+    validate_max_items,
+    validate_pattern,
+    validate_allof_anyof,
+)
+from flex.validation.schema import (
+    validator_mapping,
+    validate_required,
+    validate_min_properties,
+    validate_max_properties,
+    validate_additional_properties,
+    generate_additional_properties_validator,
+    generate_schema_validator,
+    SchemaReferenceValidator,
+)
+
+
+# Python expressions equivalent to `is_value_of_type(value, type_)`.
+TYPE_EXPRESSIONS = {
+    '': '{0} is None',
+    None: '{0} is None',
+    NULL: '{0} is None',
+    BOOLEAN: 'isinstance({0}, bool)',
+    INTEGER: '(isinstance({0}, integer_types) and not isinstance({0}, bool))',
+    NUMBER: '(isinstance({0}, number_types) and not isinstance({0}, bool))',
+    STRING: 'isinstance({0}, string_types)',
+    ARRAY: '(isinstance({0}, array_types) and not isinstance({0}, string_types))',
+    OBJECT: 'isinstance({0}, object_types)',
+}
+
+# Local variable names for the type checks that gate most constraints, which
+# are evaluated once at the start of each generated function.
+TYPE_GUARDS = collections.OrderedDict((
+    (NUMBER, '_is_number'),
+    (STRING, '_is_string'),
+    (ARRAY, '_is_array'),
+    (OBJECT, '_is_object'),
+))
+
+
+def get_type_expression(types, name='value'):
+    if not types:
+        return 'False'
+    return ' or '.join(TYPE_EXPRESSIONS[type_].format(name) for type_ in types)
+
+
+class SchemaCodeGenerator(object):
+    """
+    Generates the source for the validation functions of a schema.  Every
+    generated function takes the `value` to validate and the validation
+    `context`, and returns an `ErrorDict` which is empty if the value is valid.
+
+    While `predicate` is set, functions are instead generated to return
+    whether the value is valid, returning `False` at the first violation
+    without constructing any errors.
+    """
+    def __init__(self, context, predicate=False):
+        self.context = context
+        self.predicate = predicate
+        self.functions = []
+        self.references = {}
+        self.namespace = {
+            'EMPTY': EMPTY,
+            'ErrorDict': ErrorDict,
+            'ValidationError': ValidationError,
+            'get_type_for_value': get_type_for_value,
+            'integer_types': PRIMITIVE_TYPES[INTEGER],
+            'number_types': PRIMITIVE_TYPES[NUMBER],
+            'string_types': PRIMITIVE_TYPES[STRING],
+            'array_types': PRIMITIVE_TYPES[ARRAY],
+            'object_types': PRIMITIVE_TYPES[OBJECT],
+        }
+        self.counter = itertools.count()
+
+    @property
+    def source(self):
+        return '\n\n'.join(self.functions)
+
+    def compile(self, function_name):
+        """
+        Compiles the generated source, returning the generated function named
+        `function_name`.
+        """
+        namespace = dict(self.namespace)
+        exec(compile(self.source, '<flex-schema-validator>', 'exec'), namespace)
+        return namespace[function_name]
+
+    def get_name(self, prefix):
+        return '_{0}_{1}'.format(prefix, next(self.counter))
+
+    def add_constant(self, value):
+        name = self.get_name('c')
+        self.namespace[name] = value
+        return name
+
+    def generate(self, schema, name=None):
+        """
+        Generates the function which validates a value against the validators
+        `construct_schema_validators` constructs for `schema`, returning its
+        name.
+        """
+        if name is None:
+            name = self.get_name('validate')
+
+        guards = set()
+        checks = collections.OrderedDict()
+
+        # Checks are grouped by key in the same order that
+        # `construct_schema_validators` adds them to its `ValidationDict` so
+        # that errors are collected in the same order.
+        if '$ref' in schema:
+            self.add_check(checks, '$ref', self.reference_check(schema['$ref']))
+        if 'properties' in schema:
+            for property_, property_schema in schema['properties'].items():
+                self.add_check(
+                    checks,
+                    property_,
+                    self.property_check(property_, property_schema, guards),
+                )
+        if schema.get('additionalProperties') is False:
+            self.add_check(checks, 'additionalProperties', self.validator_check(
+                'additionalProperties',
+                generate_additional_properties_validator(context=self.context, **schema),
+                guards,
+            ))
+        for key in schema:
+            if key == 'items':
+                self.add_check(checks, key, self.items_check(schema, guards))
+            elif key in validator_mapping:
+                self.add_check(checks, key, self.validator_check(
+                    key,
+                    validator_mapping[key](context=self.context, **schema),
+                    guards,
+                ))
+
+        lines = ['def {0}(value, context):'.format(name)]
+        if not self.predicate:
+            lines.append('    errors = ErrorDict()')
+        for type_, guard in TYPE_GUARDS.items():
+            if type_ in guards:
+                lines.append('    {0} = {1}'.format(guard, get_type_expression((type_,))))
+        for line in itertools.chain.from_iterable(checks.values()):
+            lines.append('    ' + line)
+        if self.predicate:
+            lines.append('    return True')
+        else:
+            lines.append('    return errors')
+
+        self.functions.append('\n'.join(lines))
+        return name
+
+    def add_check(self, checks, key, lines):
+        checks.setdefault(key, []).extend(lines)
+
+    def add_error(self, key, error):
+        if self.predicate:
+            return 'return False'
+        return 'errors.add_error({0!r}, {1})'.format(key, error)
+
+    def call_check(self, key, call):
+        if self.predicate:
+            return [
+                'if not {0}:'.format(call),
+                '    return False',
+            ]
+        # In fail fast mode the called function raises with its first error
+        # rather than returning its errors.
+        return [
+            'try:',
+            '    _e = ' + call,
+            'except ValidationError as err:',
+            '    _e = err.detail',
+            'if _e:',
+            '    ' + self.add_error(key, '_e'),
+        ]
+
+    def fallback_check(self, key, validator):
+        return [
+            'try:',
+            '    {0}(value, context=context)'.format(self.add_constant(validator)),
+            'except ValidationError as err:',
+            '    ' + self.add_error(key, 'err.detail'),
+        ]
+
+    def predicate_names(self, schemas):
+        """
+        Generates predicate functions for `schemas` regardless of the mode of
+        the function being generated, returning their names.
+        """
+        predicate, self.predicate = self.predicate, True
+        try:
+            return [self.generate(schema) for schema in schemas]
+        finally:
+            self.predicate = predicate
+
+    def reference_check(self, reference):
+        reference_fragment = urlparse.urlparse(reference).fragment
+        try:
+            function_name = self.references[(reference_fragment, self.predicate)]
+        except KeyError:
+            schema = jsonpointer.resolve_pointer(self.context, reference_fragment)
+            if 'discriminator' in schema:
+                return self.fallback_check(
+                    '$ref', SchemaReferenceValidator(reference, self.context),
+                )
+            function_name = self.get_name('validate')
+            # Registered before generating so that self references resolve
+            # to the function being generated.
+            self.references[(reference_fragment, self.predicate)] = function_name
+            self.generate(schema, name=function_name)
+        return self.call_check('$ref', '{0}(value, context)'.format(function_name))
+
+    def property_check(self, property_, property_schema, guards):
+        if 'discriminator' in property_schema:
+            validators = ValidationDict()
+            validators.add_property_validator(property_, generate_schema_validator(
+                schema=property_schema,
+                context=self.context,
+            ))
+            return self.fallback_check(property_, validators[property_])
+        guards.add(OBJECT)
+        function_name = self.generate(property_schema)
+        return ['if _is_object:'] + [
+            '    ' + line for line in self.call_check(
+                property_,
+                '{0}(value.get({1!r}, EMPTY), context)'.format(function_name, property_),
+            )
+        ]
+
+    def items_check(self, schema, guards):
+        items = schema['items']
+        if isinstance(items, Mapping):
+            function_name = self.generate(items)
+            loop = 'for _item in value:'
+            call = '{0}(_item, context)'.format(function_name)
+        elif isinstance(items, (list, tuple)) and all(isinstance(i, Mapping) for i in items):
+            if not items:
+                return []
+            loop = 'for _validate, _item in zip(({0},), value):'.format(
+                ', '.join(self.generate(item) for item in items),
+            )
+            call = '_validate(_item, context)'
+        else:
+            return self.validator_check(
+                'items',
+                validator_mapping['items'](context=self.context, **schema),
+                guards,
+            )
+        guards.add(ARRAY)
+        return ['if _is_array:', '    ' + loop] + [
+            '        ' + line for line in self.call_check('items', call)
+        ]
+
+    def validator_check(self, key, validator, guards):
+        if validator is noop:
+            return []
+        if isinstance(validator, functools.partial):
+            inliner = self.inliners.get(validator.func)
+            if inliner is not None:
+                lines = inliner(self, key, validator.keywords, guards)
+                if lines is not None:
+                    return lines
+        return self.fallback_check(key, validator)
+
+    #
+    #  Inline implementations of the validators in `validator_mapping`,
+    #  keyed by the validation function of the partial they generate.
+    #  Returning `None` falls back to calling the validator.
+    #
+    def inline_type(self, key, keywords, guards):
+        types = keywords['types']
+        if not all(type_ in TYPE_EXPRESSIONS for type_ in types):
+            return None
+        if len(types) == 1 and types[0] in TYPE_GUARDS:
+            guards.add(types[0])
+            expression = TYPE_GUARDS[types[0]]
+        else:
+            expression = get_type_expression(types)
+        message = '{0}.format(repr(value), get_type_for_value(value), {1})'.format(
+            self.add_constant(MESSAGES['type']['invalid']),
+            self.add_constant(types),
+        )
+        return [
+            'if value is not EMPTY and not ({0}):'.format(expression),
+            '    ' + self.add_error(key, message),
+        ]
+
+    def inline_minimum(self, key, keywords, guards):
+        if keywords['is_exclusive']:
+            comparison_text, operator = "greater than", '>'
+        else:
+            comparison_text, operator = "greater than or equal to", '>='
+        return self.inline_comparison(
+            key, 'minimum', operator, comparison_text, keywords['minimum'], guards,
+        )
+
+    def inline_maximum(self, key, keywords, guards):
+        if keywords['is_exclusive']:
+            comparison_text, operator = "less than", '<'
+        else:
+            comparison_text, operator = "less than or equal to", '<='
+        return self.inline_comparison(
+            key, 'maximum', operator, comparison_text, keywords['maximum'], guards,
+        )
+
+    def inline_comparison(self, key, message_key, operator, comparison_text, limit, guards):
+        guards.add(NUMBER)
+        limit_name = self.add_constant(limit)
+        return [
+            'if _is_number and not value {0} {1}:'.format(operator, limit_name),
+            '    ' + self.add_error(key, '{0}.format(value, {1!r}, {2})'.format(
+                self.add_constant(MESSAGES[message_key]['invalid']),
+                comparison_text,
+                limit_name,
+            )),
+        ]
+
+    def inline_min_length(self, key, keywords, guards):
+        return self.inline_length(key, 'min_length', STRING, '<', keywords['minLength'], guards)
+
+    def inline_max_length(self, key, keywords, guards):
+        return self.inline_length(key, 'max_length', STRING, '>', keywords['maxLength'], guards)
+
+    def inline_length(self, key, message_key, type_, operator, limit, guards):
+        guards.add(type_)
+        limit_name = self.add_constant(limit)
+        return [
+            'if {0} and len(value) {1} {2}:'.format(TYPE_GUARDS[type_], operator, limit_name),
+            '    ' + self.add_error(key, '{0}.format({1})'.format(
+                self.add_constant(MESSAGES[message_key]['invalid']),
+                limit_name,
+            )),
+        ]
+
+    def inline_min_items(self, key, keywords, guards):
+        return self.inline_count(key, 'min_items', ARRAY, '<', 'value', keywords['minimum'], guards)
+
+    def inline_max_items(self, key, keywords, guards):
+        return self.inline_count(key, 'max_items', ARRAY, '>', 'value', keywords['maximum'], guards)
+
+    def inline_min_properties(self, key, keywords, guards):
+        return self.inline_count(
+            key, 'min_properties', OBJECT, '<', 'value.keys()', keywords['minimum'], guards,
+        )
+
+    def inline_max_properties(self, key, keywords, guards):
+        return self.inline_count(
+            key, 'max_properties', OBJECT, '>', 'value.keys()', keywords['maximum'], guards,
+        )
+
+    def inline_count(self, key, message_key, type_, operator, values, limit, guards):
+        guards.add(type_)
+        limit_name = self.add_constant(limit)
+        return [
+            'if {0} and len({1}) {2} {3}:'.format(TYPE_GUARDS[type_], values, operator, limit_name),
+            '    ' + self.add_error(key, '{0}.format({1}, len({2}))'.format(
+                self.add_constant(MESSAGES[message_key]['invalid']),
+                limit_name,
+                values,
+            )),
+        ]
+
+    def inline_pattern(self, key, keywords, guards):
+        guards.add(STRING)
+        regex_name = self.add_constant(keywords['regex'])
+        return [
+            'if _is_string and not {0}.match(value):'.format(regex_name),
+            '    ' + self.add_error(key, '{0}.format(value, {1}.pattern)'.format(
+                self.add_constant(MESSAGES['pattern']['invalid']),
+                regex_name,
+            )),
+        ]
+
+    def inline_required(self, key, keywords, guards):
+        guards.add(OBJECT)
+        message_name = self.add_constant(MESSAGES['required']['required'])
+        if self.predicate:
+            lines = []
+            for field in keywords['required_fields']:
+                lines.extend([
+                    'if _is_object and {0!r} not in value:'.format(field),
+                    '    return False',
+                ])
+            return lines
+        lines = [
+            'if _is_object:',
+            '    _required_errors = ErrorDict()',
+            '    try:',
+        ]
+        for field in keywords['required_fields']:
+            lines.extend([
+                '        if {0!r} not in value:'.format(field),
+                '            _required_errors.add_error({0!r}, {1})'.format(field, message_name),
+            ])
+        lines.extend([
+            '    except ValidationError:',
+            '        pass',
+            '    if _required_errors:',
+            '        ' + self.add_error(key, '_required_errors'),
+        ])
+        return lines
+
+    def inline_additional_properties(self, key, keywords, guards):
+        if keywords['additional_properties'] is not False:
+            return []
+        guards.add(OBJECT)
+        return [
+            'if _is_object:',
+            '    _extra_properties = set(value.keys()).difference({0})'.format(
+                self.add_constant(set(keywords['properties'].keys())),
+            ),
+            '    if _extra_properties:',
+            '        ' + self.add_error(key, '{0}.format(repr(_extra_properties))'.format(
+                self.add_constant(MESSAGES['additional_properties']['extra_properties']),
+            )),
+        ]
+
+    def inline_allof_anyof(self, key, keywords, guards):
+        sub_schemas = keywords['sub_schemas']
+        if not sub_schemas or not all(isinstance(s, Mapping) for s in sub_schemas):
+            return None
+        if keywords['method'] is all:
+            operator = ' and '
+        elif keywords['method'] is any:
+            operator = ' or '
+        else:
+            return None
+        condition = 'value is not EMPTY and not ({0})'.format(operator.join(
+            '{0}(value, context)'.format(name)
+            for name in self.predicate_names(sub_schemas)
+        ))
+        if self.predicate:
+            return ['if {0}:'.format(condition), '    return False']
+        # The sub schemas are only validated again to collect their errors
+        # once it is known that the value is invalid.
+        return ['if {0}:'.format(condition)] + [
+            '    ' + line for line in self.fallback_check(
+                key, functools.partial(validate_allof_anyof, **keywords),
+            )
+        ]
+
+    inliners = {
+        validate_type: inline_type,
+        validate_minimum: inline_minimum,
+        validate_maximum: inline_maximum,
+        validate_min_length: inline_min_length,
+        validate_max_length: inline_max_length,
+        validate_min_items: inline_min_items,
+        validate_max_items: inline_max_items,
+        validate_min_properties: inline_min_properties,
+        validate_max_properties: inline_max_properties,
+        validate_pattern: inline_pattern,
+        validate_required: inline_required,
+        validate_additional_properties: inline_additional_properties,
+        validate_allof_anyof: inline_allof_anyof,
+    }
+
+
+def generate_compiled_schema_validator(schema, context, **kwargs):
+    """
+    Drop in replacement for `generate_schema_validator` which returns a
+    validator compiled from generated python source.  The generated source is
+    available as the `source` attribute of the returned validator.
+    """
+    if 'discriminator' in schema:
+        return generate_schema_validator(schema=schema, context=context)
+
+    generator = SchemaCodeGenerator(context)
+    validate_errors = generator.compile(generator.generate(schema))
+
+    def validator(value, **kwargs):
+        errors = validate_errors(value, kwargs.get('context', context))
+        if errors:
+            raise ValidationError(errors)
+        return value
+
+    validator.source = generator.source
+    return validator
+
+
+def generate_compiled_schema_predicate(schema, context, **kwargs):
+    """
+    Returns a function which returns whether a value is valid against
+    `schema`.  Constraints with an inline implementation are checked without
+    raising any exceptions or constructing any errors.
+    """
+    if 'discriminator' in schema:
+        validator = generate_schema_validator(schema=schema, context=context)
+
+        def is_valid(value, **kwargs):
+            try:
+                validator(value, context=kwargs.get('context', context))
+            except ValidationError:
+                return False
+            return True
+        return is_valid
+
+    generator = SchemaCodeGenerator(context, predicate=True)
+    predicate = generator.compile(generator.generate(schema))
+
+    def is_valid(value, **kwargs):
+        return predicate(value, kwargs.get('context', context))
+
+    is_valid.source = generator.source
+    return is_valid
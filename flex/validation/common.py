@@ -17,6 +17,7 @@ from flex.exceptions import (
     ErrorDict,
     ErrorList,
     MultiplePathsFound,
+    is_fail_fast_mode,
 )
 from flex.datastructures import (
     ValidationDict,
@@ -32,7 +33,7 @@ from flex.utils import (
 )
 from flex.functional import chain_reduce_partial
 from flex.paths import (
-    match_path_to_api_path,
+    PathRouter,
 )
 from flex.constants import (
     NULL,
@@ -318,15 +319,26 @@ def validate_allof_anyof(value, sub_schemas, context, method, **kwargs):
         construct_schema_validators,
     )
 
+    sub_schemas_validators = [
+        construct_schema_validators(schema, context) for schema in sub_schemas
+    ]
+    if method is any:
+        # A value is valid as soon as one sub schema matches, so the errors
+        # for the sub schemas are only collected if none of them do.
+        for schema_validators in sub_schemas_validators:
+            if schema_validators.is_valid(value, context=context):
+                return value
+
     messages = []
     success = []
-    for schema in sub_schemas:
-        schema_validators = construct_schema_validators(schema, context)
+    for schema_validators in sub_schemas_validators:
         try:
             schema_validators.validate_object(value, context=context)
         except ValidationError as err:
             messages.append(err.messages)
             success.append(False)
+            if method is all and is_fail_fast_mode():
+                break
         else:
             success.append(True)
 
@@ -378,6 +390,12 @@ def validate_object(obj, field_validators=None, non_field_validators=None,
     if non_field_validators is None:
         non_field_validators = ValidationList()
 
+    if not schema and isinstance(field_validators, ValidationDict):
+        # Nothing to construct or merge, the validators were built up front.
+        field_validators.validate_object(obj, context=context)
+        non_field_validators.validate_object(obj, context=context)
+        return obj
+
     from flex.validation.schema import (
         construct_schema_validators,
     )
@@ -515,25 +533,40 @@ def validate_request_method_to_operation(request_method, path_definition):
     return operation_definition
 
 
-def validate_path_to_api_path(path, paths, basePath='', context=None, **kwargs):
+def validate_path_to_path_match(path, paths, basePath='', context=None, router=None,
+                                **kwargs):
     """
-    Given a path, find the api_path it matches.
+    Given a path, find the api_path it matches and return the `PathMatch`
+    holding it and the raw values of its path parameters.  If a prebuilt
+    `PathRouter` is provided it is used to match the path.
     """
     if context is None:
         context = {}
+    if router is None:
+        router = PathRouter(paths, base_path=basePath, context=context)
     try:
-        api_path = match_path_to_api_path(
-            path_definitions=paths,
-            target_path=path,
-            base_path=basePath,
-            context=context,
-        )
+        path_match = router.resolve(path)
     except LookupError as err:
         raise ValidationError(str(err))
     except MultiplePathsFound as err:
         raise ValidationError(str(err))
 
-    return api_path
+    return path_match
+
+
+def validate_path_to_api_path(path, paths, basePath='', context=None, router=None,
+                              **kwargs):
+    """
+    Given a path, find the api_path it matches.
+    """
+    path_match = validate_path_to_path_match(
+        path=path,
+        paths=paths,
+        basePath=basePath,
+        context=context,
+        router=router,
+    )
+    return path_match.api_path
 
 
 def validate_content_type(content_type, content_types, **kwargs):
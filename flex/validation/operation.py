@@ -22,12 +22,13 @@ from flex.parameters import (
 from flex.validation.parameter import (
     validate_query_parameters,
     construct_parameter_validators,
+    construct_multi_parameter_validators,
 )
 from flex.validation.header import (
     construct_header_validators,
 )
 from flex.validation.path import (
-    generate_path_parameters_validator,
+    generate_object_path_validator,
 )
 from flex.validation.common import (
     noop,
@@ -129,10 +130,7 @@ def generate_parameters_validator(api_path, path_definition, parameters,
     in_path_parameters = filter_parameters(all_parameters, in_=PATH)
     validators.add_validator(
         'path',
-        chain_reduce_partial(
-            attrgetter('path'),
-            generate_path_parameters_validator(api_path, in_path_parameters, context),
-        ),
+        generate_object_path_validator(api_path, in_path_parameters, context),
     )
 
     # QUERY
@@ -145,6 +143,9 @@ def generate_parameters_validator(api_path, path_definition, parameters,
                 validate_query_parameters,
                 query_parameters=in_query_parameters,
                 context=context,
+                validators=construct_multi_parameter_validators(
+                    in_query_parameters, context=context,
+                ),
             ),
         ),
     )
@@ -189,7 +190,8 @@ validator_mapping = {
 }
 
 
-def construct_operation_validators(api_path, path_definition, operation_definition, context):
+def construct_operation_validators(api_path, path_definition, operation_definition, context,
+                                   **kwargs):
     """
     - consumes (did the request conform to the content types this api consumes)
     - produces (did the response conform to the content types this endpoint produces)
@@ -72,19 +72,28 @@ def get_path_parameter_values(target_path, api_path, path_parameters, context):
     return type_cast_parameters(raw_values, path_parameters, context=context)
 
 
-def validate_path_parameters(target_path, api_path, path_parameters, context):
+def validate_path_parameters(target_path, api_path, path_parameters, context,
+                             validators=None, path_values=None):
     """
-    Helper function for validating a request path
+    Helper function for validating a request path.  If the raw `path_values`
+    were already captured while matching the path they are used rather than
+    matching the path against the api path again.
     """
-    base_path = context.get('basePath', '')
-    full_api_path = re.sub(NORMALIZE_SLASH_REGEX, '/', base_path + api_path)
-    parameter_values = get_path_parameter_values(
-        target_path, full_api_path, path_parameters, context,
+    if path_values is None:
+        base_path = context.get('basePath', '')
+        full_api_path = re.sub(NORMALIZE_SLASH_REGEX, '/', base_path + api_path)
+        parameter_values = get_path_parameter_values(
+            target_path, full_api_path, path_parameters, context,
+        )
+    else:
+        parameter_values = type_cast_parameters(path_values, path_parameters, context)
+    validate_parameters(
+        parameter_values, path_parameters, context=context, validators=validators,
     )
-    validate_parameters(parameter_values, path_parameters, context=context)
 
 
-def validate_query_parameters(raw_query_data, query_parameters, context):
+def validate_query_parameters(raw_query_data, query_parameters, context,
+                              validators=None):
     query_data = {}
     for key, value in raw_query_data.items():
         if is_non_string_iterable(value) and len(value) == 1:
@@ -92,11 +101,16 @@ def validate_query_parameters(raw_query_data, query_parameters, context):
         else:
             query_data[key] = value
     query_data = type_cast_parameters(query_data, query_parameters, context)
-    validate_parameters(query_data, query_parameters, context)
+    validate_parameters(query_data, query_parameters, context, validators=validators)
 
 
-def validate_parameters(parameter_values, parameters, context):
-    validators = construct_multi_parameter_validators(parameters, context=context)
+def validate_parameters(parameter_values, parameters, context, validators=None):
+    """
+    Validate the parameter values against the parameter definitions.  If
+    `validators` is not provided, they are constructed from `parameters`.
+    """
+    if validators is None:
+        validators = construct_multi_parameter_validators(parameters, context=context)
 
     with ErrorDict() as errors:
         for key, validator in validators.items():
@@ -168,4 +182,4 @@ def construct_multi_parameter_validators(parameters, context):
 
 
 class ParameterReferenceValidator(LazyReferenceValidator):
-    validators_constructor = construct_parameter_validators
+    validators_constructor = staticmethod(construct_parameter_validators)
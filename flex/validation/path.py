@@ -2,6 +2,7 @@ import functools
 
 from flex.validation.parameter import (
     validate_path_parameters,
+    construct_multi_parameter_validators,
 )
 
 
@@ -15,5 +16,34 @@ def generate_path_parameters_validator(api_path, path_parameters, context):
         api_path=api_path,
         path_parameters=path_parameters,
         context=context,
+        validators=construct_multi_parameter_validators(path_parameters, context=context),
     )
     return path_parameter_validator
+
+
+def validate_object_path(obj, api_path, path_parameters_validator, **kwargs):
+    """
+    Validates the path of a request or response object.  When the path was
+    matched to `api_path` during validation, the path parameter values
+    captured by that match are reused.
+    """
+    path_match = getattr(obj, 'path_match', None)
+    if path_match is not None and path_match.api_path == api_path \
+       and path_match.path == obj.path:
+        path_parameters_validator(obj.path, path_values=path_match.values, **kwargs)
+    else:
+        path_parameters_validator(obj.path, **kwargs)
+
+
+def generate_object_path_validator(api_path, path_parameters, context):
+    """
+    Generates a validator function that validates the path of a request or
+    response object against the path parameters.
+    """
+    return functools.partial(
+        validate_object_path,
+        api_path=api_path,
+        path_parameters_validator=generate_path_parameters_validator(
+            api_path, path_parameters, context,
+        ),
+    )
@@ -1,3 +1,5 @@
+import collections
+
 from six.moves import urllib_parse as urlparse
 
 import jsonpointer
@@ -7,13 +9,79 @@ from flex.validation.common import (
 )
 
 
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
+class ReferenceCache(object):
+    """
+    Cache of resolved reference targets and the validators constructed for
+    them.  Validators are constructed lazily from the resolved schema, so a
+    self referencing definition only resolves to a lazy reference validator
+    for its nested references rather than recursing.
+    """
+    def __init__(self):
+        self._schemas = {}
+        self._validators = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_schema(self, reference_fragment, context):
+        try:
+            schema = self._schemas[reference_fragment]
+        except KeyError:
+            self.misses += 1
+            schema = jsonpointer.resolve_pointer(context, reference_fragment)
+            self._schemas[reference_fragment] = schema
+        else:
+            self.hits += 1
+        return schema
+
+    def get_validators(self, reference_fragment, validators_constructor, context):
+        key = (validators_constructor, reference_fragment)
+        try:
+            validators = self._validators[key]
+        except KeyError:
+            schema = self.get_schema(reference_fragment, context)
+            self.misses += 1
+            validators = validators_constructor(schema, context)
+            self._validators[key] = validators
+        else:
+            self.hits += 1
+        return validators
+
+    def cache_info(self):
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            currsize=len(self._schemas) + len(self._validators),
+        )
+
+    def clear(self):
+        self._schemas.clear()
+        self._validators.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class SchemaContext(dict):
+    """
+    A validation context for a schema which carries a `ReferenceCache` that is
+    shared by every reference validator constructed with it.
+    """
+    def __init__(self, *args, **kwargs):
+        super(SchemaContext, self).__init__(*args, **kwargs)
+        self.reference_cache = ReferenceCache()
+
+
 class LazyReferenceValidator(object):
     """
     This class acts as a lazy validator for references in schemas to prevent an
     infinite recursion error when a schema references itself, or there is a
     reference loop between more than one schema.
 
-    The validator is only constructed if validator is needed.
+    The validator is only constructed if validator is needed, after which it is
+    cached in the `ReferenceCache` of the context, or of this validator if the
+    context does not carry one.
     """
     validators_constructor = None
 
@@ -25,27 +93,45 @@ class LazyReferenceValidator(object):
             )
 
         self.reference_fragment = urlparse.urlparse(reference).fragment
-        # TODO: something better than this which potentiall raises a
-        # JsonPointerException
-        jsonpointer.resolve_pointer(context, self.reference_fragment)
         self.reference = reference
         self.context = context
+        self.reference_cache = getattr(context, 'reference_cache', None)
+        if self.reference_cache is None:
+            self.reference_cache = ReferenceCache()
+        # TODO: something better than this which potentiall raises a
+        # JsonPointerException
+        self.reference_cache.get_schema(self.reference_fragment, context)
 
     def __call__(self, value, **kwargs):
+        from flex.validation.schema import (
+            construct_schema_validators,
+        )
+        schema = self.schema
+        if 'discriminator' in schema:
+            return validate_object(
+                value,
+                schema=schema,
+                **kwargs
+            )
         return validate_object(
             value,
-            schema=self.schema,
+            field_validators=self.reference_cache.get_validators(
+                self.reference_fragment,
+                construct_schema_validators,
+                self.context,
+            ),
             **kwargs
         )
 
     @property
     def schema(self):
-        return jsonpointer.resolve_pointer(self.context, self.reference_fragment)
+        return self.reference_cache.get_schema(self.reference_fragment, self.context)
 
     @property
     def validators(self):
-        return self.validators_constructor(
-            self.schema,
+        return self.reference_cache.get_validators(
+            self.reference_fragment,
+            self.validators_constructor,
             self.context,
         )
 
@@ -6,11 +6,12 @@ from flex.validation.operation import (
 )
 from flex.validation.common import (
     validate_request_method_to_operation,
-    validate_path_to_api_path,
+    validate_path_to_path_match,
 )
 
 
-def validate_request(request, schema):
+def validate_request(request, schema, router=None,
+                     operation_validators_factory=construct_operation_validators):
     """
     Request validation does the following steps.
 
@@ -18,19 +19,28 @@ def validate_request(request, schema):
        2. validate that the request method conforms to a supported methods for the given path.
        3. validate that the request parameters conform to the parameter
           definitions for the operation definition.
+
+    `router` is an optional prebuilt `PathRouter` for the schema paths and
+    `operation_validators_factory` is called to obtain the validators for the
+    matched operation, which allows callers to supply previously constructed
+    validators rather than building them for every request.
     """
     with ErrorDict() as errors:
         # 1
         try:
-            api_path = validate_path_to_api_path(
+            path_match = validate_path_to_path_match(
                 path=request.path,
                 context=schema,
+                router=router,
                 **schema
             )
         except ValidationError as err:
             errors['path'].add_error(err.detail)
             return  # this causes an exception to be raised since errors is no longer falsy.
 
+        api_path = path_match.api_path
+        request.path_match = path_match
+
         path_definition = schema['paths'][api_path] or {}
 
         if not path_definition:
@@ -53,8 +63,9 @@ def validate_request(request, schema):
             return
 
         # 3
-        operation_validators = construct_operation_validators(
+        operation_validators = operation_validators_factory(
             api_path=api_path,
+            method=request.method,
             path_definition=path_definition,
             operation_definition=operation_definition,
             context=schema,
@@ -7,7 +7,7 @@ from flex.functional import attrgetter, methodcaller
 from flex.context_managers import ErrorDict
 from flex.validation.common import (
     validate_object,
-    validate_path_to_api_path,
+    validate_path_to_path_match,
     validate_request_method_to_operation,
 )
 from flex.error_messages import MESSAGES
@@ -24,7 +24,15 @@ from flex.validation.header import (
     construct_header_validators,
 )
 from flex.validation.path import (
-    generate_path_parameters_validator,
+    generate_object_path_validator,
+)
+from flex.validation.schema import (
+    generate_schema_validator,
+)
+from flex.validation.stream import (
+    LazyArrayStreamValidator,
+    resolve_streamable_schema,
+    validate_streamed_response_body,
 )
 from flex.validation.common import (
     generate_value_processor,
@@ -60,13 +68,24 @@ def validate_status_code_to_response_definition(response, operation_definition):
     return response_definition
 
 
-def generate_response_body_validator(schema, context, **kwargs):
-    return chain_reduce_partial(
+def generate_response_body_validator(schema, context,
+                                     schema_validator_generator=generate_schema_validator,
+                                     **kwargs):
+    body_validator = chain_reduce_partial(
         attrgetter('data'),
-        functools.partial(
-            validate_object,
-            schema=schema,
+        schema_validator_generator(schema=schema, context=context),
+    )
+    stream_schema, reference_depth = resolve_streamable_schema(schema, context)
+    if stream_schema is None:
+        return body_validator
+    return functools.partial(
+        validate_streamed_response_body,
+        body_validator=body_validator,
+        stream_validator=LazyArrayStreamValidator(
+            schema=stream_schema,
             context=context,
+            schema_validator_generator=schema_validator_generator,
+            reference_depth=reference_depth,
         ),
     )
 
@@ -133,10 +152,7 @@ def generate_path_validator(api_path, path_definition, parameters,
 
     # PATH
     in_path_parameters = filter_parameters(all_parameters, in_=PATH)
-    return chain_reduce_partial(
-        attrgetter('path'),
-        generate_path_parameters_validator(api_path, in_path_parameters, context),
-    )
+    return generate_object_path_validator(api_path, in_path_parameters, context)
 
 
 validator_mapping = {
@@ -148,7 +164,13 @@ validator_mapping = {
 
 
 def generate_response_validator(api_path, operation_definition, response_definition,
-                                path_definition, context):
+                                path_definition, context,
+                                schema_validator_generator=generate_schema_validator,
+                                **kwargs):
+    """
+    `schema_validator_generator` is used to generate the validator for the
+    response body schema, eg. `generate_compiled_schema_validator`.
+    """
     validators = ValidationDict()
 
     # Parameters is special cause it needs data from both the
@@ -166,17 +188,29 @@ def generate_response_validator(api_path, operation_definition, response_definit
         if key in response_definition:
             validators.add_validator(
                 key,
-                validator_mapping[key](context=context, **response_definition),
+                validator_mapping[key](
+                    context=context,
+                    schema_validator_generator=schema_validator_generator,
+                    **response_definition
+                ),
             )
         elif key in operation_definition:
             validators.add_validator(
                 key,
-                validator_mapping[key](context=context, **operation_definition),
+                validator_mapping[key](
+                    context=context,
+                    schema_validator_generator=schema_validator_generator,
+                    **operation_definition
+                ),
             )
         elif key in path_definition:
             validators.add_validator(
                 key,
-                validator_mapping[key](context=context, **path_definition),
+                validator_mapping[key](
+                    context=context,
+                    schema_validator_generator=schema_validator_generator,
+                    **path_definition
+                ),
             )
 
     if 'produces' in context and 'produces' not in validators:
@@ -191,7 +225,8 @@ def generate_response_validator(api_path, operation_definition, response_definit
     )
 
 
-def validate_response(response, request_method, schema):
+def validate_response(response, request_method, schema, router=None,
+                      response_validator_factory=generate_response_validator):
     """
     Response validation involves the following steps.
        4. validate that the response status_code is in the allowed responses for
@@ -199,20 +234,28 @@ def validate_response(response, request_method, schema):
        5. validate that the response content validates against any provided
           schemas for the responses.
        6. headers, content-types, etc..., ???
+
+    `router` is an optional prebuilt `PathRouter` for the schema paths and
+    `response_validator_factory` is called to obtain the validator for the
+    matched response definition.
     """
     with ErrorDict() as errors:
         # 1
         # TODO: tests
         try:
-            api_path = validate_path_to_api_path(
+            path_match = validate_path_to_path_match(
                 path=response.path,
                 context=schema,
+                router=router,
                 **schema
             )
         except ValidationError as err:
             errors['path'].extend(list(err.messages))
             return  # this causes an exception to be raised since errors is no longer falsy.
 
+        api_path = path_match.api_path
+        response.path_match = path_match
+
         path_definition = schema['paths'][api_path] or {}
 
         # TODO: tests
@@ -235,8 +278,10 @@ def validate_response(response, request_method, schema):
             errors['status_code'].add_error(err.detail)
         else:
             # 5
-            response_validator = generate_response_validator(
-                api_path,
+            response_validator = response_validator_factory(
+                api_path=api_path,
+                request_method=request_method,
+                status_code=response.status_code,
                 operation_definition=operation_definition,
                 path_definition=path_definition,
                 response_definition=response_definition,
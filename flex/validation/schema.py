@@ -1,4 +1,3 @@
-import itertools
 import functools
 
 import six
@@ -33,7 +32,6 @@ from flex.validation.common import (
     generate_unique_items_validator,
     generate_pattern_validator,
     generate_enum_validator,
-    validate_object,
     generate_object_validator,
     generate_allof_validator,
     generate_anyof_validator,
@@ -109,15 +107,24 @@ def construct_items_validators(items, context):
 
 @skip_if_not_of_type(ARRAY)
 @skip_if_empty
-def validate_items(objs, field_validators, **kwargs):
+def validate_items(objs, items_validators, additional_items_validators=None, **kwargs):
+    """
+    Validates each element of an array against the validators for its
+    position.  `items_validators` is a sequence of validator dictionaries,
+    where elements past the end of the sequence are validated against
+    `additional_items_validators`, or not validated at all if it is `None`.
+    """
     errors = ErrorList()
-    for obj, _field_validators in zip(objs, field_validators):
+    num_items_validators = len(items_validators)
+    for index, obj in enumerate(objs):
+        if index < num_items_validators:
+            _items_validators = items_validators[index]
+        elif additional_items_validators is None:
+            break
+        else:
+            _items_validators = additional_items_validators
         try:
-            validate_object(
-                obj,
-                field_validators=_field_validators,
-                **kwargs
-            )
+            _items_validators.validate_object(obj, **kwargs)
         except ValidationError as e:
             errors.add_error(e.detail)
 
@@ -126,29 +133,34 @@ def validate_items(objs, field_validators, **kwargs):
 
 
 def generate_items_validator(items, context, **kwargs):
+    """
+    Constructs the validators for `items` once, so that the returned validator
+    holds no per call state and may be reused for any number of arrays.
+    """
     if isinstance(items, Mapping):
-        # If items is a reference or a schema, we pass it through as an
-        # ever repeating list of the same validation dictionary, thus
-        # validating all of the objects against the same schema.
-        items_validators = itertools.repeat(construct_items_validators(
-            items,
-            context,
-        ))
+        # If items is a reference or a schema, every element of the array is
+        # validated against the same validation dictionary.
+        return functools.partial(
+            validate_items,
+            items_validators=(),
+            additional_items_validators=ValidationDict(
+                construct_items_validators(items, context),
+            ),
+        )
     elif isinstance(items, Sequence):
-        # We generate a list of validator dictionaries and then chain it
-        # with an empty schema that repeats forever.  This ensures that if
-        # the array of objects to be validated is longer than the array of
-        # validators, then the extra elements will always validate since
-        # they will be validated against an empty schema.
-        items_validators = itertools.chain(
-            map(functools.partial(construct_items_validators, context=context), items),
-            itertools.repeat({}),
+        # Each element is validated against the validators at the same
+        # position.  If the array of objects to be validated is longer than
+        # the array of validators, then the extra elements will always
+        # validate since they are validated against an empty schema.
+        return functools.partial(
+            validate_items,
+            items_validators=tuple(
+                ValidationDict(construct_items_validators(item, context))
+                for item in items
+            ),
         )
     else:
         assert "Should not be possible"
-    return functools.partial(
-        validate_items, field_validators=items_validators,
-    )
 
 
 @skip_if_not_of_type(OBJECT)
@@ -219,7 +231,7 @@ def construct_schema_validators(schema, context):
         )
     if 'properties' in schema:
         for property_, property_schema in schema['properties'].items():
-            property_validator = generate_object_validator(
+            property_validator = generate_schema_validator(
                 schema=property_schema,
                 context=context,
             )
@@ -236,6 +248,21 @@ def construct_schema_validators(schema, context):
     return validators
 
 
+def generate_schema_validator(schema, context):
+    """
+    Returns a validator for the given schema with its validators constructed
+    up front rather than each time a value is validated.  Schemas with a
+    `discriminator` depend on the value being validated, so their validators
+    are still constructed at validation time.
+    """
+    if 'discriminator' in schema:
+        return generate_object_validator(schema=schema, context=context)
+    return generate_object_validator(
+        field_validators=construct_schema_validators(schema, context),
+        context=context,
+    )
+
+
 class SchemaReferenceValidator(LazyReferenceValidator):
     """
     This class acts as a lazy validator for references in schemas to prevent an
@@ -244,4 +271,4 @@ class SchemaReferenceValidator(LazyReferenceValidator):
 
     The validator is only constructed if validator is needed.
     """
-    validators_constructor = construct_schema_validators
+    validators_constructor = staticmethod(construct_schema_validators)
@@ -0,0 +1,210 @@
+"""
+Validation of json array bodies which are decoded incrementally, one element
+at a time, so that memory use is bounded by the size of a single element
+rather than the size of the body.
+"""
+import collections
+import functools
+import json
+
+import six
+
+from flex._compat import Mapping
+from flex.constants import ARRAY
+from flex.decoders import iter_json_array
+from flex.error_messages import MESSAGES
+from flex.exceptions import (
+    ValidationError,
+    ErrorDict,
+    ErrorList,
+)
+from flex.utils import dereference_reference
+from flex.validation.schema import generate_schema_validator
+
+
+# Schema keys which can only be validated against the array as a whole.
+# Bodies with schemas using any of these are decoded in full before they are
+# validated.
+NON_STREAMABLE_KEYS = ('$ref', 'allOf', 'anyOf', 'enum', 'format', 'discriminator')
+
+
+def is_streamable_schema(schema):
+    types = schema.get('type')
+    if isinstance(types, six.string_types):
+        types = [types]
+    if types != [ARRAY]:
+        return False
+    return not any(key in schema for key in NON_STREAMABLE_KEYS)
+
+
+def _peek(chunks):
+    """
+    Returns the first non whitespace character of a body read from `chunks`
+    along with an iterator which yields all of the chunks again.
+    """
+    chunks = iter(chunks)
+    read = []
+    for chunk in chunks:
+        read.append(chunk)
+        chunk = chunk.lstrip()
+        if chunk:
+            return chunk[:1], _chain(read, chunks)
+    return '', _chain(read, chunks)
+
+
+def _chain(read, chunks):
+    for chunk in read:
+        yield chunk
+    for chunk in chunks:
+        yield chunk
+
+
+def validate_array_stream(values, items_validators, additional_items_validators=None,
+                          min_items=None, max_items=None, unique_items=False,
+                          **kwargs):
+    """
+    Validates an iterable of array elements, such as `iter_json_array`,
+    against the validators for their position, consuming one element at a
+    time.  The errors are the same as those from validating the array with
+    `flex.validation.schema.validate_items` and the `minItems`, `maxItems`
+    and `uniqueItems` validators.
+    """
+    num_items_validators = len(items_validators)
+    counter = collections.Counter()
+    count = 0
+    with ErrorDict() as errors:
+        try:
+            with ErrorList() as item_errors:
+                for index, value in enumerate(values):
+                    count += 1
+                    if unique_items:
+                        counter[json.dumps(value, sort_keys=True)] += 1
+                    if index < num_items_validators:
+                        validator = items_validators[index]
+                    elif additional_items_validators is None:
+                        continue
+                    else:
+                        validator = additional_items_validators
+                    try:
+                        validator(value, **kwargs)
+                    except ValidationError as err:
+                        item_errors.add_error(err.detail)
+        except ValidationError as err:
+            errors.add_error('items', err.detail)
+
+        if min_items is not None and count < min_items:
+            errors.add_error(
+                'minItems',
+                MESSAGES['min_items']['invalid'].format(min_items, count),
+            )
+        if max_items is not None and count > max_items:
+            errors.add_error(
+                'maxItems',
+                MESSAGES['max_items']['invalid'].format(max_items, count),
+            )
+        dupes = [json.loads(v) for v, c in counter.items() if c > 1]
+        if dupes:
+            errors.add_error(
+                'uniqueItems',
+                MESSAGES['unique_items']['invalid'].format(repr(dupes)),
+            )
+
+
+def resolve_streamable_schema(schema, context):
+    """
+    Returns the array schema `schema` refers to along with the number of
+    references followed to reach it.  The schema is `None` if its values
+    cannot be validated one element at a time.
+    """
+    reference_depth = 0
+    while '$ref' in schema and len(schema) == 1:
+        schema = dereference_reference(schema['$ref'], context)
+        reference_depth += 1
+    if is_streamable_schema(schema):
+        return schema, reference_depth
+    return None, reference_depth
+
+
+def generate_array_stream_validator(schema, context,
+                                    schema_validator_generator=generate_schema_validator):
+    """
+    Returns a validator for an iterable of the elements of an array matching
+    the streamable array `schema`.
+    """
+    def generate_item_validator(item):
+        if isinstance(item, six.string_types):
+            item = {'$ref': item}
+        return schema_validator_generator(schema=item, context=context)
+
+    items = schema.get('items')
+    if items is None:
+        items_validators, additional_items_validators = (), None
+    elif isinstance(items, (Mapping, six.string_types)):
+        items_validators = ()
+        additional_items_validators = generate_item_validator(items)
+    else:
+        items_validators = tuple(generate_item_validator(item) for item in items)
+        additional_items_validators = None
+
+    return functools.partial(
+        validate_array_stream,
+        items_validators=items_validators,
+        additional_items_validators=additional_items_validators,
+        min_items=schema.get('minItems'),
+        max_items=schema.get('maxItems'),
+        unique_items=schema.get('uniqueItems', False),
+    )
+
+
+class LazyArrayStreamValidator(object):
+    """
+    Constructs the validator for a streamed array the first time a body is
+    streamed, since most bodies are not.  Errors are nested under one `$ref`
+    key for each reference followed to reach the array schema, matching the
+    errors for the same body when it is not streamed.
+    """
+    def __init__(self, schema, context, schema_validator_generator=generate_schema_validator,
+                 reference_depth=0):
+        self.schema = schema
+        self.context = context
+        self.schema_validator_generator = schema_validator_generator
+        self.reference_depth = reference_depth
+        self._validator = None
+
+    @property
+    def validator(self):
+        if self._validator is None:
+            self._validator = generate_array_stream_validator(
+                schema=self.schema,
+                context=self.context,
+                schema_validator_generator=self.schema_validator_generator,
+            )
+        return self._validator
+
+    def __call__(self, values, **kwargs):
+        try:
+            self.validator(values, **kwargs)
+        except ValidationError as err:
+            if not self.reference_depth:
+                raise
+            detail = err.detail
+            for _ in range(self.reference_depth):
+                detail = ErrorDict({'$ref': detail})
+            raise ValidationError(detail)
+
+
+def validate_streamed_response_body(response, body_validator, stream_validator, **kwargs):
+    """
+    Validates the body of a response, validating a json array which is yet
+    to be read from `response.stream` with `stream_validator` as it is
+    decoded.  Any other body is validated with `body_validator`.
+    """
+    if not response.is_streamed or not response.is_json:
+        return body_validator(response, **kwargs)
+
+    first, response.stream = _peek(response.stream)
+    if first not in ('[', b'['):
+        return body_validator(response, **kwargs)
+
+    stream, response.stream = response.stream, ()
+    stream_validator(iter_json_array(stream), **kwargs)
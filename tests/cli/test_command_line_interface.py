@@ -1,3 +1,4 @@
+import json
 import os
 
 import click
@@ -49,3 +50,36 @@ def test_flex_cli_schema_validation_with_invalid_schema():
 
     assert result.exit_code == 1
     assert "Invalid value. 2.1 is not one of the available options (['2.0'])" in result.output
+
+
+def test_flex_cli_batch_validation(tmpdir):
+    traffic = tmpdir.join('traffic.jsonl')
+    traffic.write('\n'.join(
+        json.dumps({
+            'request': {'method': 'GET', 'url': 'http://www.example.com/users'},
+            'response': {
+                'status_code': status_code,
+                'headers': {'Content-Type': 'application/json'},
+                'body': 'ok',
+            },
+        })
+        for status_code in (200, 500, 200)
+    ))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            'batch',
+            '--source',
+            os.path.join(DIR, 'schemas/cli-test-valid-schema.yaml'),
+            '--processes',
+            '1',
+            str(traffic),
+        ]
+    )
+
+    assert result.exit_code == 1, result.output
+    assert 'Call 1 is invalid' in result.output
+    assert 'Validated 3 api calls' in result.output
+    assert '1 invalid' in result.output
@@ -0,0 +1,205 @@
+import asyncio
+import concurrent.futures
+import json
+
+import pytest
+
+import flex
+from flex import aio
+from flex.constants import (
+    ARRAY,
+    INTEGER,
+    OBJECT,
+    QUERY,
+)
+from flex.exceptions import ValidationError
+from flex.http import Response
+
+from tests.factories import (
+    RawSchemaFactory,
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+RAW_SCHEMA = RawSchemaFactory(
+    paths={
+        '/pets': {
+            'get': {
+                'parameters': [
+                    {'name': 'limit', 'in': QUERY, 'type': INTEGER, 'maximum': 10},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            'type': ARRAY,
+                            'items': {
+                                'type': OBJECT,
+                                'required': ['id'],
+                                'properties': {'id': {'type': INTEGER}},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super(RecordingExecutor, self).__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super(RecordingExecutor, self).submit(*args, **kwargs)
+
+
+async def iter_chunks(*chunks):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def get_response(content, **kwargs):
+    return ResponseFactory(url='http://www.example.com/pets', content=content, **kwargs)
+
+
+@pytest.fixture(params=[False, True], ids=['schema', 'compiled'])
+def schema(request):
+    schema = flex.load(RAW_SCHEMA)
+    if request.param:
+        return flex.compile(schema)
+    return schema
+
+
+def test_load():
+    executor = RecordingExecutor()
+    schema = run(aio.load(RAW_SCHEMA, executor=executor))
+
+    assert schema == flex.load(RAW_SCHEMA)
+    assert executor.submitted == 1
+
+
+def test_validate_api_request(schema):
+    run(aio.validate_api_request(
+        schema, RequestFactory(url='http://www.example.com/pets?limit=5'),
+    ))
+    with pytest.raises(ValidationError):
+        run(aio.validate_api_request(
+            schema, RequestFactory(url='http://www.example.com/pets?limit=50'),
+        ))
+
+
+def test_validate_api_response(schema):
+    run(aio.validate_api_response(schema, get_response(json.dumps([{'id': 1}]))))
+    with pytest.raises(ValidationError):
+        run(aio.validate_api_response(schema, get_response(json.dumps([{'id': 'a'}]))))
+
+
+def test_validate_api_call(schema):
+    request = RequestFactory(url='http://www.example.com/pets?limit=5')
+    run(aio.validate_api_call(schema, request, get_response(json.dumps([{'id': 1}]))))
+    with pytest.raises(ValidationError):
+        run(aio.validate_api_call(schema, request, get_response(json.dumps([{}]))))
+
+
+def test_large_bodies_are_validated_in_executor(schema):
+    executor = RecordingExecutor()
+    small = get_response(json.dumps([{'id': 1}]))
+    large = get_response(json.dumps([{'id': index} for index in range(100)]))
+
+    run(aio.validate_api_response(schema, small, executor=executor, threshold=100))
+    assert executor.submitted == 0
+
+    run(aio.validate_api_response(schema, large, executor=executor, threshold=100))
+    assert executor.submitted == 1
+
+    large.content = json.dumps([{'id': 'a'}] * 100)
+    with pytest.raises(ValidationError):
+        run(aio.validate_api_response(schema, large, executor=executor, threshold=100))
+
+
+def test_response_with_async_stream(schema):
+    response = get_response(None, stream=iter_chunks(b'[{"id": 1},', b' {"id": "a"}]'))
+
+    with pytest.raises(ValidationError):
+        run(aio.validate_api_response(schema, response))
+    assert response.content == b'[{"id": 1}, {"id": "a"}]'
+
+
+def receive_messages(*messages):
+    messages = list(messages)
+
+    async def receive():
+        return messages.pop(0)
+    return receive
+
+
+ASGI_SCOPE = {
+    'type': 'http',
+    'scheme': 'https',
+    'method': 'POST',
+    'root_path': '',
+    'path': '/pets',
+    'query_string': b'limit=5',
+    'headers': [
+        (b'host', b'www.example.com'),
+        (b'content-type', b'application/json'),
+        (b'x-tag', b'a'),
+        (b'x-tag', b'b'),
+    ],
+    'server': ('127.0.0.1', 8000),
+}
+
+
+def test_normalize_asgi_request():
+    receive = receive_messages(
+        {'type': 'http.request', 'body': b'{"id":', 'more_body': True},
+        {'type': 'http.request', 'body': b' 1}', 'more_body': False},
+    )
+    request = run(aio.normalize_asgi_request(ASGI_SCOPE, receive))
+
+    assert request.url == 'https://www.example.com/pets?limit=5'
+    assert request.method == 'post'
+    assert request.query_data == {'limit': ['5']}
+    assert request.data == {'id': 1}
+    assert request.headers['X-Tag'] == 'a,b'
+
+
+def test_normalize_asgi_request_rejects_other_scopes():
+    with pytest.raises(TypeError):
+        run(aio.normalize_asgi_request({'type': 'websocket'}, receive_messages()))
+
+
+def test_normalize_asgi_response(schema):
+    request = run(aio.normalize_asgi_request(
+        dict(ASGI_SCOPE, method='GET', headers=[(b'host', b'www.example.com')]),
+        receive_messages({'type': 'http.request', 'body': b''}),
+    ))
+    response = aio.normalize_asgi_response([
+        {
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'application/json')],
+        },
+        {'type': 'http.response.body', 'body': b'[{"id": 1}', 'more_body': True},
+        {'type': 'http.response.body', 'body': b']'},
+    ], request)
+
+    assert isinstance(response, Response)
+    assert response.status_code == '200'
+    assert response.data == [{'id': 1}]
+
+    run(aio.validate_api_call(schema, request, response))
@@ -0,0 +1,176 @@
+import base64
+import json
+import pickle
+
+import pytest
+
+import flex
+from flex.batch import (
+    BatchResult,
+    iter_har_records,
+    iter_jsonl_records,
+    validate_api_calls,
+)
+from flex.constants import (
+    ARRAY,
+    EMPTY,
+    INTEGER,
+    OBJECT,
+    QUERY,
+)
+from flex.exceptions import ValidationError
+from flex.http import (
+    NOT_PARSED,
+    Request,
+    Response,
+)
+
+from tests.factories import RawSchemaFactory
+
+
+RAW_SCHEMA = RawSchemaFactory(
+    paths={
+        '/pets': {
+            'get': {
+                'parameters': [
+                    {'name': 'limit', 'in': QUERY, 'type': INTEGER, 'maximum': 10},
+                ],
+                'responses': {
+                    '200': {
+                        'description': 'Success',
+                        'schema': {
+                            'type': ARRAY,
+                            'items': {
+                                'type': OBJECT,
+                                'required': ['id'],
+                                'properties': {'id': {'type': INTEGER}},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+
+
+def make_line(limit, body):
+    return json.dumps({
+        'request': {
+            'method': 'GET',
+            'url': 'http://www.example.com/pets?limit={0}'.format(limit),
+        },
+        'response': {
+            'status_code': 200,
+            'headers': {'Content-Type': 'application/json'},
+            'body': body,
+        },
+    })
+
+
+def make_lines(count):
+    lines = []
+    for index in range(count):
+        if index % 7 == 3:
+            lines.append(make_line(50, [{'id': index}]))
+        elif index % 7 == 5:
+            lines.append(make_line(5, [{'id': 'not-an-integer'}]))
+        else:
+            lines.append(make_line(5, [{'id': index}]))
+    return lines
+
+
+def is_expected_valid(index):
+    return index % 7 not in (3, 5)
+
+
+@pytest.mark.parametrize('processes', (1, 2))
+def test_validate_api_calls_in_order(processes):
+    schema = flex.load(RAW_SCHEMA)
+    records = iter_jsonl_records(make_lines(50))
+
+    results = list(validate_api_calls(schema, records, processes=processes, chunk_size=4))
+
+    assert [result.index for result in results] == list(range(50))
+    assert [result.is_valid for result in results] == [
+        is_expected_valid(index) for index in range(50)
+    ]
+    assert all(
+        isinstance(result.error, ValidationError)
+        for result in results if not result.is_valid
+    )
+
+
+def test_validate_api_calls_reads_records_lazily():
+    schema = flex.load(RAW_SCHEMA)
+    read = []
+
+    def iter_records():
+        for index, record in enumerate(iter_jsonl_records(make_lines(1000))):
+            read.append(index)
+            yield record
+
+    results = validate_api_calls(schema, iter_records(), processes=2, chunk_size=10)
+    assert next(results).index == 0
+    results.close()
+
+    assert len(read) < 1000
+
+
+def test_batch_result_is_picklable():
+    try:
+        flex.core.validate_api_call(
+            flex.load(RAW_SCHEMA), *next(iter_jsonl_records([make_line(50, [])]))
+        )
+    except ValidationError as err:
+        result = BatchResult(0, err)
+
+    unpickled = pickle.loads(pickle.dumps(result))
+
+    assert not unpickled.is_valid
+    assert unpickled.error.detail == result.error.detail
+
+
+def test_normalized_objects_are_picklable():
+    request, response = next(iter_jsonl_records([make_line(5, None)]))
+
+    request, response = pickle.loads(pickle.dumps((request, response)))
+
+    assert response.content is EMPTY
+    assert response._data is NOT_PARSED
+    assert response.data is EMPTY
+
+
+def test_iter_har_records():
+    har = {
+        'log': {
+            'entries': [
+                {
+                    'request': {
+                        'method': 'POST',
+                        'url': 'http://www.example.com/pets',
+                        'headers': [{'name': 'Content-Type', 'value': 'application/json'}],
+                        'postData': {'mimeType': 'application/json', 'text': '{"id": 1}'},
+                    },
+                    'response': {
+                        'status': 201,
+                        'headers': [{'name': 'content-type', 'value': 'application/json'}],
+                        'content': {
+                            'mimeType': 'application/json',
+                            'text': base64.b64encode(b'[1, 2]').decode('ascii'),
+                            'encoding': 'base64',
+                        },
+                    },
+                },
+            ],
+        },
+    }
+
+    (request, response), = iter_har_records(har)
+
+    assert isinstance(request, Request)
+    assert request.method == 'post'
+    assert request.data == {'id': 1}
+    assert isinstance(response, Response)
+    assert response.status_code == '201'
+    assert response.data == [1, 2]
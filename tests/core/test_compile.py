@@ -0,0 +1,205 @@
+import os
+import json
+
+import pytest
+
+import flex
+from flex.compiled import SchemaValidator
+from flex.exceptions import ValidationError
+from flex.error_messages import MESSAGES
+from flex.constants import (
+    PATH,
+    QUERY,
+    INTEGER,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+    ResponseFactory,
+)
+from tests.utils import assert_message_in_errors
+
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture()
+def schema():
+    return SchemaFactory(
+        paths={
+            '/get/{id}/': {
+                'parameters': [
+                    {'name': 'id', 'in': PATH, 'type': INTEGER, 'required': True},
+                ],
+                'get': {
+                    'parameters': [
+                        {'name': 'page', 'in': QUERY, 'type': INTEGER, 'minimum': 1},
+                    ],
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': {
+                                'type': 'object',
+                                'required': ['id'],
+                                'properties': {'id': {'type': INTEGER}},
+                            },
+                        },
+                        'default': {'description': 'Unexpected error'},
+                    },
+                },
+            },
+        },
+    )
+
+
+def test_compile_returns_schema_validator(schema):
+    validator = flex.compile(schema)
+
+    assert isinstance(validator, SchemaValidator)
+    assert validator.schema is schema
+
+
+def test_compile_builds_all_validators_up_front(schema):
+    validator = flex.compile(schema)
+
+    assert set(validator._operation_validators) == {('/get/{id}/', 'get')}
+    assert set(validator._response_validators) == {
+        ('/get/{id}/', 'get', '200'),
+        ('/get/{id}/', 'get', 'default'),
+    }
+
+
+def test_compiled_validators_are_not_rebuilt_per_request(schema, monkeypatch):
+    validator = flex.compile(schema)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validators should not be constructed per request")
+
+    monkeypatch.setattr('flex.compiled.construct_operation_validators', fail)
+    monkeypatch.setattr('flex.compiled.generate_response_validator', fail)
+
+    request = RequestFactory(url='http://www.example.com/get/1234/?page=2')
+    response = ResponseFactory(
+        url='http://www.example.com/get/1234/',
+        content=json.dumps({'id': 1234}),
+    )
+
+    for _ in range(3):
+        validator.validate_request(request)
+        validator.validate_response(response)
+        validator.validate_api_call(request, response)
+
+
+def test_compiled_request_validation_errors(schema):
+    validator = flex.compile(schema)
+    request = RequestFactory(url='http://www.example.com/get/1234/?page=0')
+
+    with pytest.raises(ValidationError) as err:
+        validator.validate_request(request)
+
+    assert_message_in_errors(
+        MESSAGES['minimum']['invalid'],
+        err.value.detail,
+        'method.parameters.query.page.minimum',
+    )
+
+
+def test_compiled_request_validation_with_unknown_path(schema):
+    validator = flex.compile(schema)
+    request = RequestFactory(url='http://www.example.com/not-an-api-path')
+
+    with pytest.raises(ValidationError) as err:
+        validator.validate_request(request)
+
+    assert_message_in_errors(
+        MESSAGES['path']['no_matching_paths_found'],
+        err.value.detail,
+        'path',
+    )
+
+
+def test_compiled_response_validation_errors(schema):
+    validator = flex.compile(schema)
+    response = ResponseFactory(
+        url='http://www.example.com/get/1234/',
+        content=json.dumps({'id': 'abc'}),
+    )
+
+    with pytest.raises(ValidationError) as err:
+        validator.validate_response(response)
+
+    assert_message_in_errors(
+        MESSAGES['type']['invalid'],
+        err.value.detail,
+        'body.schema.id.type',
+    )
+
+
+def test_compiled_response_validation_uses_default_response(schema):
+    validator = flex.compile(schema)
+    response = ResponseFactory(
+        url='http://www.example.com/get/1234/',
+        status_code=500,
+        content=json.dumps({'anything': 'goes'}),
+    )
+
+    validator.validate_response(response)
+
+    assert ('/get/{id}/', 'get', '500') in validator._response_validators
+
+
+def test_compiled_api_call_validation(schema):
+    validator = flex.compile(schema)
+    request = RequestFactory(url='http://www.example.com/get/1234/?page=0')
+    response = ResponseFactory(url='http://www.example.com/get/1234/')
+
+    with pytest.raises(ValidationError) as err:
+        validator.validate_api_call(request, response)
+
+    assert_message_in_errors(
+        MESSAGES['minimum']['invalid'],
+        err.value.detail,
+        'request',
+    )
+
+
+def test_compile_example_schema():
+    schema = flex.load(os.path.join(DIR, 'example_schemas', 'petstore-expanded.yaml'))
+    validator = flex.compile(schema)
+
+    request = RequestFactory(url='http://petstore.swagger.wordnik.com/api/pets/123')
+    validator.validate_request(request)
+
+
+def test_codegen_response_validation_errors(schema):
+    response = ResponseFactory(
+        url='http://www.example.com/get/1234/',
+        content=json.dumps({'id': 'abc'}),
+    )
+
+    with pytest.raises(ValidationError) as expected:
+        flex.compile(schema).validate_response(response)
+    with pytest.raises(ValidationError) as err:
+        flex.compile(schema, codegen=True).validate_response(response)
+
+    assert err.value.detail == expected.value.detail
+    assert_message_in_errors(
+        MESSAGES['type']['invalid'],
+        err.value.detail,
+        'body.schema.id.type',
+    )
+
+
+def test_codegen_response_validation_uses_generated_validator(schema):
+    validator = flex.compile(schema, codegen=True)
+    response = ResponseFactory(
+        url='http://www.example.com/get/1234/',
+        content=json.dumps({'id': 1234}),
+    )
+
+    validator.validate_response(response)
+
+    response_validator = validator._response_validators[('/get/{id}/', 'get', '200')]
+    body_validator = response_validator.keywords['field_validators']['schema'][0]
+    assert hasattr(body_validator.keywords['functions'][1], 'source')
@@ -1,6 +1,11 @@
+import pytest
+
 from flex.exceptions import (
     ErrorList,
     ErrorDict,
+    ValidationError,
+    fail_fast_mode,
+    is_fail_fast_mode,
 )
 
 
@@ -15,3 +20,19 @@ def test_instantiation_with_initial_value():
     error_dict = ErrorDict(value)
     assert 'a' in error_dict
     assert 3 in error_dict['a']
+
+
+def test_adding_error_in_fail_fast_mode_raises():
+    error_dict = ErrorDict()
+    with fail_fast_mode():
+        with pytest.raises(ValidationError) as err:
+            error_dict.add_error('a', 'error')
+    assert err.value.detail == {'a': ['error']}
+
+
+def test_fail_fast_mode_is_restored():
+    with fail_fast_mode():
+        with fail_fast_mode(False):
+            assert not is_fail_fast_mode()
+        assert is_fail_fast_mode()
+    assert not is_fail_fast_mode()
@@ -1,5 +1,9 @@
+import pytest
+
 from flex.exceptions import (
     ErrorList,
+    ValidationError,
+    fail_fast_mode,
 )
 
 
@@ -36,3 +40,18 @@ def test_adding_mixed_list():
     error_list = ErrorList()
     error_list.add_error([1, 2, [3, 4], 'abc'])
     assert error_list == [1, 2, 3, 4, 'abc']
+
+
+def test_adding_error_in_fail_fast_mode_raises():
+    error_list = ErrorList()
+    with fail_fast_mode():
+        with pytest.raises(ValidationError) as err:
+            error_list.add_error([1, 2])
+    assert err.value.detail == [1, 2]
+
+
+def test_adding_no_errors_in_fail_fast_mode_does_not_raise():
+    error_list = ErrorList()
+    with fail_fast_mode():
+        error_list.add_error([])
+    assert error_list == []
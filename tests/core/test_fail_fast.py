@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+import flex
+from flex.core import (
+    validate,
+    validate_api_request,
+    validate_api_response,
+)
+from flex.exceptions import ValidationError
+from flex.constants import (
+    ARRAY,
+    INTEGER,
+    OBJECT,
+    QUERY,
+    STRING,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+def count_errors(errors):
+    if isinstance(errors, dict):
+        return sum(count_errors(value) for value in errors.values())
+    elif isinstance(errors, list):
+        return sum(count_errors(value) for value in errors)
+    return 1
+
+
+ITEMS_SCHEMA = {
+    'type': ARRAY,
+    'items': {
+        'type': OBJECT,
+        'required': ['id'],
+        'properties': {
+            'id': {'type': INTEGER},
+            'name': {'type': STRING},
+        },
+    },
+}
+
+INVALID_ITEMS = [{'id': 'abc', 'name': 1} for _ in range(100)]
+
+
+@pytest.fixture()
+def schema():
+    return SchemaFactory(
+        paths={
+            '/get': {
+                'get': {
+                    'parameters': [
+                        {'name': 'page', 'in': QUERY, 'type': INTEGER, 'minimum': 1},
+                        {'name': 'size', 'in': QUERY, 'type': INTEGER, 'maximum': 10},
+                    ],
+                    'responses': {
+                        '200': {'description': 'Success', 'schema': ITEMS_SCHEMA},
+                    },
+                },
+            },
+        },
+    )
+
+
+def test_validate_collects_every_error_by_default():
+    with pytest.raises(ValidationError) as err:
+        validate(ITEMS_SCHEMA, INVALID_ITEMS)
+
+    assert count_errors(err.value.detail) == 200
+
+
+def test_validate_fail_fast_stops_at_first_error():
+    with pytest.raises(ValidationError) as err:
+        validate(ITEMS_SCHEMA, INVALID_ITEMS, fail_fast=True)
+
+    assert count_errors(err.value.detail) == 1
+    assert 'items' in err.value.detail
+
+
+def test_validate_fail_fast_with_valid_target():
+    validate(ITEMS_SCHEMA, [{'id': 1, 'name': 'abc'}], fail_fast=True)
+
+
+def test_validate_api_request_fail_fast(schema):
+    request = RequestFactory(url='http://www.example.com/get?page=0&size=20')
+
+    with pytest.raises(ValidationError) as err:
+        validate_api_request(schema, request)
+    assert count_errors(err.value.detail) == 2
+
+    with pytest.raises(ValidationError) as err:
+        validate_api_request(schema, request, fail_fast=True)
+    assert count_errors(err.value.detail) == 1
+
+
+@pytest.mark.parametrize('codegen', (False, True))
+def test_validate_response_fail_fast(schema, codegen):
+    response = ResponseFactory(
+        url='http://www.example.com/get',
+        content=json.dumps(INVALID_ITEMS),
+    )
+
+    with pytest.raises(ValidationError) as err:
+        validate_api_response(schema, response, fail_fast=True)
+    assert count_errors(err.value.detail) == 1
+
+    validator = flex.compile(schema, codegen=codegen)
+    with pytest.raises(ValidationError) as compiled_err:
+        validator.validate_response(response, fail_fast=True)
+
+    assert compiled_err.value.detail == err.value.detail
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import flex
+from flex.core import (
+    is_valid,
+    is_valid_api_request,
+    is_valid_api_response,
+)
+from flex.constants import (
+    INTEGER,
+    QUERY,
+)
+
+from tests.factories import (
+    SchemaFactory,
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+@pytest.fixture()
+def schema():
+    return SchemaFactory(
+        paths={
+            '/get': {
+                'get': {
+                    'parameters': [
+                        {'name': 'page', 'in': QUERY, 'type': INTEGER, 'minimum': 1},
+                    ],
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': {'type': 'array', 'items': {'type': INTEGER}},
+                        },
+                    },
+                },
+            },
+        },
+    )
+
+
+def test_is_valid():
+    assert is_valid({'type': INTEGER, 'minimum': 1}, 1) is True
+    assert is_valid({'type': INTEGER, 'minimum': 1}, 0) is False
+
+
+@pytest.mark.parametrize(
+    'url,expected',
+    (
+        ('http://www.example.com/get?page=1', True),
+        ('http://www.example.com/get?page=0', False),
+        ('http://www.example.com/unknown', False),
+    ),
+)
+def test_is_valid_api_request(schema, url, expected):
+    request = RequestFactory(url=url)
+
+    assert is_valid_api_request(schema, request) is expected
+    assert flex.compile(schema).is_valid_request(request) is expected
+
+
+@pytest.mark.parametrize(
+    'content,expected',
+    (
+        ([1, 2, 3], True),
+        ([1, 'a', 'b'], False),
+    ),
+)
+@pytest.mark.parametrize('codegen', (False, True))
+def test_is_valid_api_response(schema, content, expected, codegen):
+    response = ResponseFactory(
+        url='http://www.example.com/get',
+        content=json.dumps(content),
+    )
+
+    assert is_valid_api_response(schema, response) is expected
+    assert flex.compile(schema, codegen=codegen).is_valid_response(response) is expected
@@ -0,0 +1,145 @@
+import json
+
+import pytest
+
+from flex.core import load_source
+from flex.decoders import (
+    JSON_DECODERS,
+    STDLIB,
+    JSONDecodeError,
+    decode_json,
+    get_json_decoder,
+    iter_json_array,
+    json_decoder,
+    register_json_decoder,
+    set_json_decoder,
+)
+
+from tests.factories import (
+    RequestFactory,
+    ResponseFactory,
+)
+
+
+@pytest.fixture(params=list(JSON_DECODERS.keys()))
+def decoder(request):
+    with json_decoder(request.param):
+        yield request.param
+
+
+@pytest.fixture
+def recording_decoder():
+    calls = []
+
+    def loads(raw):
+        calls.append(raw)
+        return json.loads(raw)
+
+    register_json_decoder('recording', loads)
+    try:
+        with json_decoder('recording'):
+            yield calls
+    finally:
+        JSON_DECODERS.pop('recording')
+
+
+def test_stdlib_decoder_is_always_available():
+    assert STDLIB in JSON_DECODERS
+    assert list(JSON_DECODERS.keys())[-1] == STDLIB
+
+
+def test_unknown_decoder_is_rejected():
+    previous = get_json_decoder()
+    with pytest.raises(ValueError):
+        set_json_decoder('not-a-decoder')
+    assert get_json_decoder() == previous
+
+
+def test_json_decoder_context_manager_restores_previous_decoder():
+    previous = get_json_decoder()
+    with json_decoder(STDLIB):
+        assert get_json_decoder() == STDLIB
+    assert get_json_decoder() == previous
+
+
+@pytest.mark.parametrize(
+    'raw',
+    (
+        '{"foo": [1, 2.5, "bar", null, true]}',
+        b'{"foo": "\xc3\xa9"}',
+        '[1e400, NaN, -Infinity]',
+        '9223372036854775807',
+    ),
+)
+def test_decoders_match_stdlib(decoder, raw):
+    expected = json.loads(raw.decode('utf-8') if isinstance(raw, bytes) else raw)
+    actual = decode_json(raw)
+
+    assert json.dumps(actual) == json.dumps(expected)
+
+
+@pytest.mark.parametrize(
+    'raw',
+    (
+        '{"foo": ',
+        'not-json',
+        b'\xff\xfe',
+        '',
+    ),
+)
+def test_decoders_raise_json_decode_error(decoder, raw):
+    with pytest.raises(JSONDecodeError):
+        decode_json(raw)
+
+
+def test_request_data_uses_selected_decoder(recording_decoder):
+    request = RequestFactory(body='{"foo": 1}', content_type='application/json')
+
+    assert request.data == {'foo': 1}
+    assert recording_decoder == ['{"foo": 1}']
+
+
+def test_response_data_uses_selected_decoder(recording_decoder):
+    response = ResponseFactory(content=b'{"foo": 1}')
+
+    assert response.data == {'foo': 1}
+    assert recording_decoder == [b'{"foo": 1}']
+
+
+def test_load_source_uses_selected_decoder(recording_decoder):
+    assert load_source('{"foo": 1}') == {'foo': 1}
+    assert recording_decoder == ['{"foo": 1}']
+
+
+def test_load_source_falls_back_to_yaml(decoder):
+    assert load_source('foo: 1') == {'foo': 1}
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 4096))
+def test_iter_json_array(chunk_size):
+    value = [{'id': 1, 'name': '\xe9'}, 12345, 1.5, None, True, [], 'abc']
+    content = json.dumps(value, ensure_ascii=False).encode('utf-8')
+    chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+    assert list(iter_json_array(chunks)) == value
+
+
+def test_iter_json_array_with_text_chunks():
+    assert list(iter_json_array([' [ 1 , 2', '3 ] ', ''])) == [1, 23]
+
+
+@pytest.mark.parametrize(
+    'raw',
+    (
+        '',
+        '{}',
+        '[1,]',
+        '[1 2]',
+        '[1',
+        '[1]x',
+        b'[1]\xc3',
+    ),
+)
+def test_iter_json_array_raises_json_decode_error(raw):
+    with pytest.raises(JSONDecodeError):
+        list(iter_json_array([raw]))
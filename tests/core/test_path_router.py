@@ -0,0 +1,149 @@
+import pytest
+
+from flex.exceptions import MultiplePathsFound
+from flex.paths import (
+    PathRouter,
+    path_to_regex,
+)
+from flex.constants import (
+    PATH,
+    INTEGER,
+    STRING,
+)
+from tests.factories import SchemaFactory
+
+
+def path_parameter(name, type_=STRING):
+    return {'name': name, 'in': PATH, 'type': type_, 'required': True}
+
+
+@pytest.fixture()
+def router():
+    schema = SchemaFactory(
+        basePath='/api',
+        paths={
+            '/pets': {},
+            '/pets/search': {},
+            '/pets/{id}': {'parameters': [path_parameter('id', INTEGER)]},
+            '/pets/{name}/photos': {'parameters': [path_parameter('name')]},
+            '/files/{name}.{ext}': {
+                'parameters': [path_parameter('name'), path_parameter('ext')],
+            },
+            '/undeclared/{thing}': {},
+        },
+    )
+    return PathRouter(schema['paths'], base_path=schema['basePath'], context=schema)
+
+
+@pytest.mark.parametrize(
+    'target_path,api_path',
+    (
+        ('/api/pets', '/pets'),
+        ('/api//pets', '/pets'),
+        ('/api/pets/search', '/pets/search'),
+        ('/api/pets/1234', '/pets/{id}'),
+        ('/api/pets/fido/photos', '/pets/{name}/photos'),
+        ('/api/files/report.tar.gz', '/files/{name}.{ext}'),
+        ('/api/undeclared/{thing}', '/undeclared/{thing}'),
+    ),
+)
+def test_router_matches_api_paths(router, target_path, api_path):
+    assert router.match(target_path) == api_path
+
+
+@pytest.mark.parametrize(
+    'target_path',
+    (
+        '/pets',
+        '/api/pets/abc',
+        '/api/pets/',
+        '/api/pets/1234/extra',
+        '/api/files/report',
+        '/api/undeclared/thing',
+    ),
+)
+def test_router_does_not_match(router, target_path):
+    with pytest.raises(LookupError):
+        router.match(target_path)
+
+
+def test_router_prefers_exact_match_over_parametrized_match():
+    schema = SchemaFactory(
+        paths={
+            '/api/v1/search/': {},
+            '/api/v1/{longer_id}/': {'parameters': [path_parameter('longer_id')]},
+        },
+    )
+    router = PathRouter(schema['paths'], context=schema)
+
+    assert router.match('/api/v1/search/') == '/api/v1/search/'
+    assert router.match('/api/v1/other/') == '/api/v1/{longer_id}/'
+
+
+def test_router_prefers_longest_parametrized_match():
+    schema = SchemaFactory(
+        paths={
+            '/{a}/{b}': {
+                'parameters': [path_parameter('a'), path_parameter('b')],
+            },
+            '/{a}/{longer}': {
+                'parameters': [path_parameter('a'), path_parameter('longer')],
+            },
+        },
+    )
+    router = PathRouter(schema['paths'], context=schema)
+
+    assert router.match('/x/y') == '/{a}/{longer}'
+
+
+def test_router_raises_for_ambiguous_matches():
+    schema = SchemaFactory(
+        paths={
+            '/{a}/{b}': {
+                'parameters': [path_parameter('a'), path_parameter('b')],
+            },
+            '/{c}/{d}': {
+                'parameters': [path_parameter('c'), path_parameter('d')],
+            },
+        },
+    )
+    router = PathRouter(schema['paths'], context=schema)
+
+    with pytest.raises(MultiplePathsFound):
+        router.match('/x/y')
+
+
+def test_router_uses_regex_for_paths_with_special_characters():
+    schema = SchemaFactory(
+        paths={
+            '/items+/{id}': {'parameters': [path_parameter('id', INTEGER)]},
+        },
+    )
+    router = PathRouter(schema['paths'], context=schema)
+
+    assert router.regex_paths
+    assert router.match('/itemsss/1') == '/items+/{id}'
+
+
+def test_router_resolve_returns_captured_path_values(router):
+    path_match = router.resolve('/api/files/report.tar.gz')
+
+    assert path_match.api_path == '/files/{name}.{ext}'
+    assert path_match.path == '/api/files/report.tar.gz'
+    assert path_match.values == {'name': 'report.tar', 'ext': 'gz'}
+
+
+def test_router_resolve_for_exact_match_has_values(router):
+    path_match = router.resolve('/api/pets/search')
+
+    assert path_match.api_path == '/pets/search'
+    assert path_match.values == {}
+
+
+def test_path_to_regex_is_memoized():
+    parameters = [path_parameter('id', INTEGER)]
+
+    assert path_to_regex('/get/{id}', parameters) is path_to_regex('/get/{id}', parameters)
+    assert path_to_regex('/get/{id}', parameters) is not path_to_regex(
+        '/get/{id}', [path_parameter('id', STRING)],
+    )
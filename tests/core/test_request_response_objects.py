@@ -38,3 +38,57 @@ def test_response_data_as_json():
     response = ResponseFactory(content=json.dumps(expected))
 
     assert response.data == expected
+
+
+def test_response_data_is_parsed_once(monkeypatch):
+    response = ResponseFactory(content=json.dumps({'foo': '1234'}))
+    data = response.data
+
+    monkeypatch.setattr('flex.http.decode_json', None)
+
+    assert response.data is data
+
+
+def test_response_data_is_invalidated_when_content_is_reassigned():
+    response = ResponseFactory(content=json.dumps({'foo': '1234'}))
+    assert response.data == {'foo': '1234'}
+
+    response.content = json.dumps({'bar': '5678'})
+    assert response.data == {'bar': '5678'}
+
+
+def test_response_with_already_parsed_data():
+    data = {'foo': '1234'}
+    response = ResponseFactory(content='not-json', data=data)
+
+    assert response.data is data
+
+
+def test_request_data_is_parsed_once(monkeypatch):
+    request = RequestFactory(
+        body=json.dumps({'foo': '1234'}),
+        content_type='application/json',
+    )
+    data = request.data
+
+    monkeypatch.setattr('flex.http.decode_json', None)
+
+    assert request.data is data
+
+
+def test_request_data_is_invalidated_when_body_is_reassigned():
+    request = RequestFactory(
+        body=json.dumps({'foo': '1234'}),
+        content_type='application/json',
+    )
+    assert request.data == {'foo': '1234'}
+
+    request.body = json.dumps({'bar': '5678'})
+    assert request.data == {'bar': '5678'}
+
+
+def test_request_with_already_parsed_data():
+    request = RequestFactory(content_type='application/json')
+    request.data = {'foo': '1234'}
+
+    assert request.data == {'foo': '1234'}
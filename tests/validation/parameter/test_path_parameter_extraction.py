@@ -41,3 +41,25 @@ def test_getting_parameter_values_from_path():
     assert 'id' in values
     assert isinstance(values['username'], six.string_types)
     assert isinstance(values['id'], int)
+
+
+#
+#  validate_path_parameters tests
+#
+def test_validating_path_parameters_uses_captured_values(monkeypatch):
+    from flex.validation import parameter
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the path should not be matched again")
+
+    monkeypatch.setattr(parameter, 'get_path_parameter_values', fail)
+
+    parameters = parameters_validator([ID_IN_PATH])
+
+    parameter.validate_path_parameters(
+        target_path='/get/1234/',
+        api_path='/get/{id}/',
+        path_parameters=parameters,
+        context={},
+        path_values={'id': '1234'},
+    )
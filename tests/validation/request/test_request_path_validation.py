@@ -251,3 +251,43 @@ def test_request_validation_with_parameter_as_reference_for_invalid_value():
         err.value.detail,
         'path',
     )
+
+
+def test_request_path_parameters_reuse_values_from_path_matching(monkeypatch):
+    """
+    Test that the path parameter values captured while matching the request
+    path are validated without matching the path a second time.
+    """
+    from flex.validation import parameter
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the path should not be matched again")
+
+    monkeypatch.setattr(parameter, 'get_path_parameter_values', fail)
+
+    schema = SchemaFactory(
+        paths={
+            '/get/{id}': {
+                'get': {'responses': {'200': {'description': 'Success'}}},
+                'parameters': [
+                    {
+                        'name': 'id',
+                        'in': PATH,
+                        'description': 'The Primary Key',
+                        'type': INTEGER,
+                        'required': True,
+                    }
+                ]
+            },
+        }
+    )
+
+    request = RequestFactory(url='http://www.example.com/get/1234')
+
+    validate_request(
+        request=request,
+        schema=schema,
+    )
+
+    assert request.path_match.api_path == '/get/{id}'
+    assert request.path_match.values == {'id': '1234'}
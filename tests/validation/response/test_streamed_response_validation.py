@@ -0,0 +1,156 @@
+import io
+import json
+
+import pytest
+import requests
+
+from flex.constants import (
+    ARRAY,
+    INTEGER,
+    OBJECT,
+    STRING,
+)
+from flex.decoders import JSONDecodeError
+from flex.exceptions import (
+    ValidationError,
+    fail_fast_mode,
+)
+from flex.http import normalize_streaming_response
+from flex.validation.response import validate_response
+
+from tests.factories import (
+    SchemaFactory,
+    ResponseFactory,
+)
+
+
+PET = {
+    'type': OBJECT,
+    'required': ['id', 'name'],
+    'properties': {
+        'id': {'type': INTEGER, 'minimum': 1},
+        'name': {'type': STRING},
+    },
+}
+
+
+def get_schema(response_schema):
+    return SchemaFactory(
+        definitions={'Pet': PET, 'Pets': {'type': ARRAY, 'items': {'$ref': '#/definitions/Pet'}}},
+        paths={
+            '/pets': {
+                'get': {
+                    'responses': {
+                        '200': {
+                            'description': 'Success',
+                            'schema': response_schema,
+                        },
+                    },
+                },
+            },
+        },
+    )
+
+
+def iter_chunks(content, size):
+    for index in range(0, len(content), size):
+        yield content[index:index + size]
+
+
+def get_errors(schema, **kwargs):
+    response = ResponseFactory(url='http://www.example.com/pets', **kwargs)
+    try:
+        validate_response(response=response, request_method='get', schema=schema)
+    except ValidationError as err:
+        return err.detail
+    return None
+
+
+@pytest.mark.parametrize(
+    'response_schema,body',
+    (
+        ({'$ref': '#/definitions/Pets'}, [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]),
+        ({'$ref': '#/definitions/Pets'}, [{'id': 0, 'name': 'a'}, {'id': 2}, 'not-a-pet']),
+        ({'type': ARRAY, 'items': {'type': INTEGER}, 'minItems': 3}, [1, 'a']),
+        ({'type': ARRAY, 'maxItems': 1, 'uniqueItems': True}, [1, {'a': 1}, 1, {'a': 1}]),
+        ({'type': ARRAY, 'items': [{'type': INTEGER}, {'type': STRING}]}, ['a', 1, 'extra']),
+        ({'type': ARRAY, 'items': {'type': INTEGER}}, []),
+        ({'type': ARRAY}, {'not': 'an-array'}),
+        ({'type': ARRAY, 'enum': [[1, 2]]}, [1, 2, 3]),
+    ),
+)
+@pytest.mark.parametrize('chunk_size', (1, 7, 4096))
+def test_streamed_body_has_same_errors_as_content(response_schema, body, chunk_size):
+    schema = get_schema(response_schema)
+    content = json.dumps(body).encode('utf-8')
+
+    expected = get_errors(schema, content=content)
+    actual = get_errors(
+        schema, content=None, stream=iter_chunks(content, chunk_size),
+    )
+
+    assert actual == expected
+
+
+def test_streamed_body_is_validated_as_it_is_read():
+    schema = get_schema({'$ref': '#/definitions/Pets'})
+    chunks_read = []
+
+    def iter_body():
+        yield b'['
+        for index in range(1000):
+            chunks_read.append(index)
+            yield json.dumps({'id': index, 'name': 'pet'}).encode('utf-8') + b','
+        yield b'{"id": 1000, "name": "pet"}]'
+
+    response = ResponseFactory(
+        url='http://www.example.com/pets', content=None, stream=iter_body(),
+    )
+
+    with fail_fast_mode():
+        with pytest.raises(ValidationError):
+            validate_response(response=response, request_method='get', schema=schema)
+
+    # validation stopped at the first element, which has an `id` of 0.
+    assert len(chunks_read) < 5
+
+
+def test_streamed_body_with_invalid_json():
+    schema = get_schema({'$ref': '#/definitions/Pets'})
+    response = ResponseFactory(
+        url='http://www.example.com/pets', content=None, stream=[b'[{"id": 1,', b' "name"]'],
+    )
+
+    with pytest.raises(JSONDecodeError):
+        validate_response(response=response, request_method='get', schema=schema)
+
+
+def test_already_parsed_streamed_body_uses_parsed_data():
+    schema = get_schema({'$ref': '#/definitions/Pets'})
+    response = ResponseFactory(
+        url='http://www.example.com/pets',
+        content=None,
+        stream=[b'[{"id": 1, "name": "a"}]'],
+    )
+    assert response.data == [{'id': 1, 'name': 'a'}]
+    assert not response.is_streamed
+
+    validate_response(response=response, request_method='get', schema=schema)
+
+
+def test_normalize_streaming_requests_response():
+    raw_response = requests.Response()
+    raw_response.raw = io.BytesIO(b'[{"id": 1, "name": "a"}, {"id": 0}]')
+    raw_response.status_code = 200
+    raw_response.url = 'http://www.example.com/pets'
+    raw_response.headers['Content-Type'] = 'application/json'
+
+    response = normalize_streaming_response(raw_response, chunk_size=4)
+
+    assert response.is_streamed
+    with pytest.raises(ValidationError):
+        validate_response(
+            response=response,
+            request_method='get',
+            schema=get_schema({'$ref': '#/definitions/Pets'}),
+        )
@@ -99,3 +99,27 @@ def test_anyof_complex():
         validator_without_anyof(bad_data)
 
     validator_with_anyof(bad_data)
+
+
+def test_anyof_stops_at_first_matching_schema(monkeypatch):
+    from flex.datastructures import ValidationDict
+
+    checked = []
+    is_valid = ValidationDict.is_valid
+
+    def record_is_valid(self, obj, **kwargs):
+        checked.append(obj)
+        return is_valid(self, obj, **kwargs)
+
+    monkeypatch.setattr(ValidationDict, 'is_valid', record_is_valid)
+
+    schema = {
+        "anyOf": [
+            {"type": STRING},
+            {"type": INTEGER},
+        ]
+    }
+    validator = generate_validator_from_schema(schema)
+    validator("abc")
+
+    assert checked == ["abc"]
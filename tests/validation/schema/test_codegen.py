@@ -0,0 +1,207 @@
+import functools
+import re
+
+import pytest
+
+from flex.exceptions import ValidationError
+from flex.constants import (
+    NULL,
+    BOOLEAN,
+    INTEGER,
+    NUMBER,
+    STRING,
+    ARRAY,
+    OBJECT,
+    EMPTY,
+)
+from flex.loading.definitions.schema_definitions import (
+    schema_definitions_validator,
+)
+from flex.loading.schema.paths.path_item.operation.responses.single.schema import (
+    schema_validator,
+)
+from flex.validation.common import validate_object
+from flex.validation.codegen import (
+    generate_compiled_schema_validator,
+    generate_compiled_schema_predicate,
+)
+
+
+def get_errors(validator, value):
+    try:
+        validator(value)
+    except ValidationError as err:
+        return err.detail
+    return None
+
+
+def assert_same_errors(raw_schema, value, context=None):
+    if context is None:
+        context = {}
+    schema = schema_validator(raw_schema, context=context)
+    validator = functools.partial(validate_object, schema=schema, context=context)
+    compiled_validator = generate_compiled_schema_validator(schema, context)
+    predicate = generate_compiled_schema_predicate(schema, context)
+
+    expected = get_errors(validator, value)
+    actual = get_errors(compiled_validator, value)
+
+    assert predicate(value) is (expected is None)
+    assert actual == expected
+    assert type(actual) is type(expected)
+    if expected is not None:
+        assert repr(actual) == repr(expected)
+    return actual
+
+
+NODE_DEFINITIONS = {
+    'Node': {
+        'type': OBJECT,
+        'required': ['value'],
+        'properties': {
+            'parent': {'$ref': '#/definitions/Node'},
+            'value': {'type': STRING, 'minLength': 2},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    'schema,value',
+    (
+        ({'type': STRING}, 'abc'),
+        ({'type': STRING}, 1),
+        ({'type': [STRING, NULL]}, None),
+        ({'type': [INTEGER, BOOLEAN]}, 1.5),
+        ({'type': INTEGER}, True),
+        ({'type': NUMBER}, True),
+        ({'type': ARRAY}, 'abc'),
+        ({'type': OBJECT}, []),
+        ({'type': STRING, 'x-nullable': True}, None),
+        ({'minimum': 3}, 2),
+        ({'minimum': 3, 'exclusiveMinimum': True}, 3),
+        ({'maximum': 3}, 4),
+        ({'maximum': 3, 'exclusiveMaximum': True}, 3),
+        ({'maximum': 3}, 'not-a-number'),
+        ({'multipleOf': 3}, 7),
+        ({'minLength': 3, 'maxLength': 5}, 'ab'),
+        ({'minLength': 3, 'maxLength': 5}, 'abcdef'),
+        ({'pattern': '^[a-z]+$'}, 'abc1'),
+        ({'format': 'uuid'}, 'not-a-uuid'),
+        ({'format': 'unknown-format'}, 'value'),
+        ({'enum': ['a', 'b']}, 'c'),
+        ({'enum': ['a', 'b'], 'x-nullable': True}, None),
+        ({'minItems': 2, 'maxItems': 3}, [1]),
+        ({'minItems': 2, 'maxItems': 3}, [1, 2, 3, 4]),
+        ({'uniqueItems': True}, [1, 2, 1]),
+        ({'minProperties': 2}, {'a': 1}),
+        ({'maxProperties': 1}, {'a': 1, 'b': 2}),
+        ({'required': ['a', 'b']}, {'c': 1}),
+        ({'required': ['a', 'b']}, 'not-an-object'),
+        (
+            {'properties': {'a': {'type': STRING}}, 'additionalProperties': False},
+            {'a': 1, 'b': 2, 'c': 3},
+        ),
+        (
+            {
+                'type': OBJECT,
+                'required': ['id'],
+                'properties': {
+                    'id': {'type': INTEGER, 'minimum': 1},
+                    'type': {'type': STRING},
+                    'tags': {
+                        'type': ARRAY,
+                        'items': {'type': STRING, 'maxLength': 3},
+                    },
+                },
+            },
+            {'id': 0, 'type': 5, 'tags': ['abc', 'abcd', 1]},
+        ),
+        (
+            {'type': ARRAY, 'items': [{'type': INTEGER}, {'type': STRING}]},
+            ['a', 1, 'extra'],
+        ),
+        (
+            {'allOf': [{'type': STRING}, {'minLength': 5}]},
+            'abc',
+        ),
+        (
+            {'anyOf': [{'type': INTEGER}, {'type': NULL}]},
+            'abc',
+        ),
+        (
+            {'anyOf': [{'type': INTEGER}, {'type': NULL}]},
+            None,
+        ),
+        (
+            {'allOf': [{'type': STRING}, {'minLength': 2}]},
+            'abc',
+        ),
+    ),
+)
+def test_compiled_validator_raises_same_errors(schema, value):
+    assert_same_errors(schema, value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        {'value': 'ab', 'parent': {'value': 'cd', 'parent': {'value': 'ef'}}},
+        {'value': 'a', 'parent': {'value': 1234, 'parent': {}}},
+        [],
+        EMPTY,
+    ),
+)
+def test_compiled_validator_with_self_reference(value):
+    context = {
+        'definitions': schema_definitions_validator(
+            NODE_DEFINITIONS,
+            context={'deferred_references': set()},
+        ),
+    }
+    assert_same_errors(
+        {'type': ARRAY, 'items': {'$ref': '#/definitions/Node'}},
+        [value],
+        context=context,
+    )
+
+
+def test_compiled_validator_is_reusable():
+    schema = schema_validator({
+        'type': ARRAY,
+        'items': [{'type': INTEGER}, {'type': STRING}],
+    })
+    validator = generate_compiled_schema_validator(schema, {})
+
+    for _ in range(3):
+        assert validator([1, 'a', None]) == [1, 'a', None]
+        with pytest.raises(ValidationError):
+            validator(['a', 1])
+
+
+def test_compiled_validator_exposes_generated_source():
+    schema = schema_validator({
+        'properties': {'count': {'type': INTEGER, 'minimum': 0}},
+    })
+    validator = generate_compiled_schema_validator(schema, {})
+
+    assert re.search(r'value \>= _c_\d+', validator.source)
+
+
+def test_compiled_predicate_does_not_construct_errors():
+    schema = schema_validator({
+        'type': OBJECT,
+        'required': ['id'],
+        'properties': {
+            'id': {'type': INTEGER, 'minimum': 1},
+            'tags': {'type': ARRAY, 'items': {'type': STRING, 'maxLength': 3}},
+            'value': {'anyOf': [{'type': INTEGER}, {'type': NULL}]},
+        },
+    })
+    predicate = generate_compiled_schema_predicate(schema, {})
+
+    assert 'ErrorDict' not in predicate.source
+    assert 'ValidationError' not in predicate.source
+    assert predicate({'id': 1, 'tags': ['abc'], 'value': None}) is True
+    assert predicate({'id': 1, 'tags': ['abcd']}) is False
+    assert predicate({'tags': []}) is False
@@ -114,3 +114,38 @@ def test_items_past_the_number_of_schemas_provided_are_skipped():
         [0, 5, 10, 20, 30, 40],
         # 20, 30, and 40 don't conform, but are beyond the declared number of schemas.
     )
+
+
+def test_list_of_schemas_validator_is_reusable():
+    schema = {
+        'type': ARRAY,
+        'items': [
+            {'type': INTEGER},
+            {'type': STRING},
+        ],
+    }
+
+    validator = generate_validator_from_schema(schema)
+
+    for _ in range(3):
+        validator([1, 'abc', 'extra'])
+        with pytest.raises(ValidationError) as err:
+            validator(['abc', 1])
+
+        assert_path_in_errors('items.0.type', err.value.detail)
+        assert_path_in_errors('items.1.type', err.value.detail)
+
+
+def test_large_array_against_single_schema():
+    schema = {
+        'type': ARRAY,
+        'items': {'type': INTEGER, 'minimum': 0},
+    }
+
+    validator = generate_validator_from_schema(schema)
+
+    validator(list(range(10000)))
+    with pytest.raises(ValidationError) as err:
+        validator(list(range(10000)) + [-1])
+
+    assert_path_in_errors('items', err.value.detail)
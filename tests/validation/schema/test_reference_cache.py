@@ -0,0 +1,90 @@
+import pytest
+
+from flex.exceptions import ValidationError
+from flex.loading.definitions.schema_definitions import (
+    schema_definitions_validator,
+)
+from flex.validation.reference import (
+    SchemaContext,
+)
+from flex.validation.schema import (
+    construct_schema_validators,
+)
+from flex.constants import (
+    ARRAY,
+    STRING,
+)
+from flex.error_messages import MESSAGES
+
+from tests.utils import (
+    generate_validator_from_schema,
+    assert_message_in_errors,
+)
+
+
+def get_node_definitions():
+    return schema_definitions_validator(
+        {
+            'Node': {
+                'properties': {
+                    'parent': {'$ref': '#/definitions/Node'},
+                    'value': {'type': STRING},
+                },
+            },
+        },
+        context={'deferred_references': set()},
+    )
+
+
+def test_references_are_resolved_once_per_context():
+    context = SchemaContext({'definitions': get_node_definitions()})
+    validator = generate_validator_from_schema(
+        {'type': ARRAY, 'items': {'$ref': '#/definitions/Node'}},
+        context=context,
+    )
+
+    validator([{'value': 'a'}])
+    misses = context.reference_cache.cache_info().misses
+
+    validator([{'value': 'a'}, {'value': 'b', 'parent': {'value': 'c'}}] * 10)
+    info = context.reference_cache.cache_info()
+
+    assert info.misses == misses
+    assert info.hits > 0
+
+
+def test_reference_validators_are_shared_across_reference_validators():
+    context = SchemaContext({'definitions': get_node_definitions()})
+    first = construct_schema_validators({'$ref': '#/definitions/Node'}, context)
+    second = construct_schema_validators({'$ref': '#/definitions/Node'}, context)
+
+    assert first['$ref'][0].validators is second['$ref'][0].validators
+
+
+def test_cached_self_reference_detects_nested_errors():
+    context = SchemaContext({'definitions': get_node_definitions()})
+    validator = generate_validator_from_schema(
+        {'$ref': '#/definitions/Node'},
+        context=context,
+    )
+
+    with pytest.raises(ValidationError) as err:
+        validator({
+            'value': 'a',
+            'parent': {'value': 'b', 'parent': {'value': 1234}},
+        })
+
+    assert_message_in_errors(
+        MESSAGES['type']['invalid'],
+        err.value.detail,
+        'parent.parent.value',
+    )
+
+
+def test_plain_context_falls_back_to_per_validator_cache():
+    validator = generate_validator_from_schema(
+        {'$ref': '#/definitions/Node'},
+        context={'definitions': get_node_definitions()},
+    )
+
+    validator({'value': 'a', 'parent': {'value': 'b'}})